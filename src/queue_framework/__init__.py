@@ -29,6 +29,7 @@ from .constants import EntityState, RequestResult
 # Lift the base class and KPI tracker
 from .base_model import BaseQueueModel
 from .measure import Measure
+from .report import KPIReport
 
 # Lift the concrete model implementations from the 'models' sub-package
 from .models import (
@@ -49,6 +50,7 @@ __all__ = [
     # Core Classes
     "BaseQueueModel",
     "Measure",
+    "KPIReport",
     
     # Concrete Models
     "FIFOQueueModel",
@@ -0,0 +1,71 @@
+# src/queue_framework/_kernels.py
+
+"""
+Numeric kernels for the end-of-run KPI reductions.
+
+The functions in this module are written as plain loops over
+float64 arrays so that Numba can compile them. If Numba is installed
+(e.g., via the `[speedups]` extra), they are JIT-compiled on first
+use and the compiled code is cached on disk; otherwise they remain
+ordinary Python functions and `Measure` keeps using its NumPy or
+pure-Python code paths instead.
+"""
+
+from typing import Tuple
+
+# Optional Dependency Handling
+# Numba is NOT a dependency of the core framework.
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+HAVE_NUMBA: bool = njit is not None
+
+
+def welford(data) -> Tuple[float, float]:
+    """
+    Computes the mean and sample variance of 'data' in a single pass
+    using Welford's online algorithm.
+
+    Returns:
+        Tuple[float, float]: (mean, variance). The variance is 0.0
+                             when fewer than two samples are given.
+    """
+    n = 0
+    mean = 0.0
+    m2 = 0.0
+    for i in range(len(data)):
+        x = data[i]
+        n += 1
+        delta = x - mean
+        mean += delta / n
+        m2 += delta * (x - mean)
+
+    if n < 2:
+        return mean, 0.0
+    return mean, m2 / (n - 1)
+
+
+def time_weighted_average(times, values, start_time: float,
+                          total_duration: float) -> float:
+    """
+    Computes the time-weighted average of a step series that starts
+    at 0 at 'start_time' and holds each value until the next timestamp
+    (the last one until the end of the run).
+    """
+    integral = 0.0
+    last_time = start_time
+    last_value = 0.0
+    for i in range(len(times)):
+        integral += last_value * (times[i] - last_time)
+        last_time = times[i]
+        last_value = values[i]
+
+    integral += last_value * (total_duration - (last_time - start_time))
+    return integral / total_duration
+
+
+if HAVE_NUMBA:
+    welford = njit(cache=True, fastmath=True)(welford)
+    time_weighted_average = njit(cache=True)(time_weighted_average)
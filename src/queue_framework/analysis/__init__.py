@@ -6,11 +6,12 @@ Initializes the 'analysis' sub-package.
 This package provides optional utilities for plotting and visualizing
 KPI data generated by the core framework.
 
-This sub-package requires optional dependencies (matplotlib, seaborn, pandas)
+This sub-package requires optional dependencies (matplotlib, seaborn, numpy)
 which are not part of the core installation.
 """
 
 import logging
+from importlib.util import find_spec
 
 log = logging.getLogger(__name__)
 
@@ -21,15 +22,20 @@ log = logging.getLogger(__name__)
 # the core 'queue_framework' import.
 
 try:
+    # matplotlib and seaborn are only imported on the first plotting
+    # call (see plotting._lazy_plt), so we check that they are
+    # installed without paying their import cost here.
+    for _dependency in ("matplotlib", "seaborn"):
+        if find_spec(_dependency) is None:
+            raise ImportError(f"No module named '{_dependency}'")
+
     # "Lift" the plotting functions from the plotting module
     # to this package's top level.
     from .plotting import (
         plot_wait_time_histogram,
         plot_system_time_histogram,
         plot_queue_length_over_time,
-        plot_server_utilization_over_time,
-        plot_transient_analysis,
-        plot_batch_means_over_time
+        plot_server_utilization_over_time
     )
 
     # Define the public API of this sub-package
@@ -41,7 +47,7 @@ try:
     ]
 
 except ImportError:
-    # This block executes if matplotlib, seaborn, or pandas are missing.
+    # This block executes if matplotlib, seaborn, or numpy are missing.
     log.warning(
         "Optional dependencies for 'queue_framework.analysis' not found. "
         "Plotting functions will be unavailable. "
@@ -49,4 +55,4 @@ except ImportError:
     )
     
     # Define an empty public API
-    __all__ = []
\ No newline at end of file
+    __all__ = []
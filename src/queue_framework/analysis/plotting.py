@@ -3,38 +3,113 @@
 """
 Provides optional plotting utilities for visualizing KPI data.
 
-This module depends on 'matplotlib', 'seaborn', and 'pandas', which
+This module depends on 'matplotlib', 'seaborn', and 'numpy', which
 are not part of the core framework's dependencies. These are
 intended to be installed via the '[analysis]' extra:
 
     pip install queue-framework[analysis]
 
+'matplotlib' and 'seaborn' are imported lazily, on the first call to
+a plotting function, so that importing this module stays cheap for
+scripts that never draw a chart.
+
 All functions are designed to work with a 'Measure' object as
 their primary data source.
 """
 
+from __future__ import annotations
+
 import logging
-from typing import Optional, List, Tuple, Dict, Any
-
-# Optional Dependency Handling
-try:
-    import matplotlib.pyplot as plt 
-    import matplotlib.axes          
-    import seaborn as sns           
-    from matplotlib.ticker import PercentFormatter
-except ImportError:
-    log = logging.getLogger(__name__)
-    log.error("Analysis dependencies (matplotlib, seaborn, pandas, numpy) not found.")
-    log.error("Please install them with: pip install queue-framework[analysis]")
-    # We re-raise the error to stop execution if these functions are called
-    raise
+from typing import TYPE_CHECKING, Optional, List, Tuple, Dict, Any
+
+import numpy as np
 
 from ..measure import Measure
 
+if TYPE_CHECKING:
+    import matplotlib.axes
+
 log = logging.getLogger(__name__)
 
-# Set a nice default style for the plots
-sns.set_theme(style="whitegrid")
+# Step series longer than this are rasterized (see _plot_steps)
+_RASTERIZE_THRESHOLD = 10_000
+
+# Lazily imported plotting libraries (see _lazy_plt)
+plt = None
+sns = None
+
+
+def _lazy_plt():
+    """
+    Imports matplotlib and seaborn on first use and returns them.
+
+    The default seaborn theme is applied once, on this first call
+    rather than when the module is imported, so that merely importing
+    this module has no side effects.
+
+    Returns:
+        Tuple: The (matplotlib.pyplot, seaborn) modules.
+
+    Raises:
+        ImportError: If the analysis dependencies are not installed.
+    """
+    global plt, sns
+    if plt is None:
+        # Optional Dependency Handling
+        try:
+            import matplotlib.pyplot as _plt
+            import seaborn as _sns
+        except ImportError:
+            log.error("Analysis dependencies (matplotlib, seaborn) not found.")
+            log.error("Please install them with: "
+                      "pip install queue-framework[analysis]")
+            # We re-raise the error to stop execution of the plotting call
+            raise
+
+        # Set a nice default style for the plots
+        _sns.set_theme(style="whitegrid")
+        plt, sns = _plt, _sns
+
+    return plt, sns
+
+def _final_kpis(measure: Measure) -> Dict[str, Any]:
+    """
+    Returns the final KPI report of 'measure' at its last update time.
+
+    Repeated calls are cheap: Measure memoizes the underlying report.
+    """
+    return measure.get_final_kpis(measure.last_update_time)
+
+
+def _staircase(times: np.ndarray, values: np.ndarray
+               ) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Expands a step series into explicit staircase vertices.
+
+    Plotting the result with ax.plot() draws the same line as
+    ax.step(times, values, where='post'), but the 2N vertices are
+    built once with np.repeat. The times stay float64 (float32 would
+    merge distinct steps in long runs, e.g. 1e7 + 0.5 rounds to 1e7);
+    only the small integer values are handed over as float32.
+    """
+    x = np.repeat(np.asarray(times, dtype=np.float64), 2)[1:]
+    y = np.repeat(values, 2)[:-1]
+    return x, y.astype(np.float32)
+
+
+def _plot_steps(ax: matplotlib.axes.Axes, times: np.ndarray,
+                values: np.ndarray):
+    """
+    Draws a post-step time series on 'ax'.
+
+    Series longer than _RASTERIZE_THRESHOLD points are rasterized
+    (with a thinner line): as vectors they dominate render time and
+    make PDF/SVG output very large.
+    """
+    large = len(times) > _RASTERIZE_THRESHOLD
+    ax.plot(*_staircase(times, values),
+            linewidth=0.8 if large else 1.0,
+            rasterized=large)
 
 
 def plot_wait_time_histogram(
@@ -59,6 +134,8 @@ def plot_wait_time_histogram(
     Returns:
         matplotlib.axes.Axes: The Axes object with the plot.
     """
+    plt, sns = _lazy_plt()
+
     if ax is None:
         fig, ax = plt.subplots(figsize=(10, 6))
 
@@ -67,11 +144,15 @@ def plot_wait_time_histogram(
         ax.set_title("Wait Time Distribution (No Data)")
         return ax
 
-    wait_stats = measure.get_final_kpis(measure.last_update_time)['wait_time']
-    mean_wait = wait_stats['mean']
+    mean_wait = measure.mean_wait_time
+
+    # Single precision is plenty for a histogram and halves the
+    # amount of data seaborn has to bin.
+    wait_arr = np.fromiter(measure.wait_times, dtype=np.float32,
+                           count=len(measure.wait_times))
 
     sns.histplot(
-        measure.wait_times, 
+        wait_arr, 
         bins=bins, 
         kde=kde, 
         ax=ax,
@@ -90,7 +171,7 @@ def plot_wait_time_histogram(
     ax.set_ylabel("Frequency / Density")
     ax.legend()
     
-    log.debug(f"Plotted wait time histogram (n={wait_stats['count']})")
+    log.debug(f"Plotted wait time histogram (n={len(measure.wait_times)})")
     
     return ax
 
@@ -113,30 +194,31 @@ def plot_queue_length_over_time(
     Returns:
         matplotlib.axes.Axes: The Axes object with the plot.
     """
+    plt, _ = _lazy_plt()
+
     if ax is None:
         fig, ax = plt.subplots(figsize=(12, 6))
 
-    if len(measure.queue_length_log) < 2:
+    if len(measure.queue_length_times) < 2:
         log.warning("Not enough queue length data to plot. Plot will be empty.")
         ax.set_title("Queue Length Over Time (No Data)")
         return ax
 
     # A step plot requires x and y data.
-    # We extract (timestamp, queue_length) from the log.
-    data = measure.queue_length_log
+    # The Measure already stores them as two parallel series.
+    times = np.asarray(measure.queue_length_times, dtype=np.float64)
+    lengths = np.asarray(measure.queue_length_values)
     
     # We also need to add a final point at the end_time
     # to make the plot "complete" to the end of the simulation.
     end_time = measure.last_update_time
-    if data[-1][0] < end_time:
-        data.append((end_time, data[-1][1]))
+    if times[-1] < end_time:
+        times = np.r_[times, end_time]
+        lengths = np.r_[lengths, lengths[-1]]
 
-    # Unzip the list of tuples into two lists
-    times, lengths = zip(*data)
-
-    ax.step(times, lengths, where='post')
+    _plot_steps(ax, times, lengths)
     
-    q_stats = measure.get_final_kpis(end_time)['queue_length']
+    q_stats = _final_kpis(measure)['queue_length']
     avg_len = q_stats['time_weighted_average']
     
     ax.axhline(
@@ -180,6 +262,8 @@ def plot_system_time_histogram(
     Returns:
         matplotlib.axes.Axes: The Axes object with the plot.
     """
+    plt, sns = _lazy_plt()
+
     if ax is None:
         fig, ax = plt.subplots(figsize=(10, 6))
 
@@ -188,12 +272,15 @@ def plot_system_time_histogram(
         ax.set_title("System Time Distribution (No Data)")
         return ax
 
-    # Retrieve pre-calculated stats from the measure object
-    system_stats = measure.get_final_kpis(measure.last_update_time)['system_time']
-    mean_system_time = system_stats['mean']
+    # Retrieve the (cached) mean from the measure object
+    mean_system_time = measure.mean_system_time
+
+    # Single precision is plenty for a histogram (see wait times above)
+    system_arr = np.fromiter(measure.system_times, dtype=np.float32,
+                             count=len(measure.system_times))
 
     sns.histplot(
-        measure.system_times, 
+        system_arr, 
         bins=bins, 
         kde=kde, 
         ax=ax,
@@ -213,7 +300,7 @@ def plot_system_time_histogram(
     ax.set_ylabel("Frequency / Density")
     ax.legend()
     
-    log.debug(f"Plotted system time histogram (n={system_stats['count']})")
+    log.debug(f"Plotted system time histogram (n={len(measure.system_times)})")
     
     return ax
 
@@ -241,36 +328,42 @@ def plot_server_utilization_over_time(
     Returns:
         matplotlib.axes.Axes: The Axes object with the plot.
     """
+    plt, _ = _lazy_plt()
+
     if ax is None:
         fig, ax = plt.subplots(figsize=(12, 6))
 
-    if len(measure.server_busy_log) < 2:
+    if len(measure.server_busy_times) < 2:
         log.warning("Not enough server utilization data to plot. Plot will be empty.")
         ax.set_title("Server Utilization Over Time (No Data)")
         return ax
 
     # Extract data from the log
-    data = measure.server_busy_log
+    times = np.asarray(measure.server_busy_times, dtype=np.float64)
+    busy_counts = np.asarray(measure.server_busy_values)
     end_time = measure.last_update_time
     
     # Add a final data point to make the step plot span the full time
-    if data and data[-1][0] < end_time:
-        data.append((end_time, data[-1][1]))
-
-    times, busy_counts = zip(*data)
+    if times[-1] < end_time:
+        times = np.r_[times, end_time]
+        busy_counts = np.r_[busy_counts, busy_counts[-1]]
 
     # Determine data to plot (percentage or absolute)
     if as_percentage:
         if measure.capacity == 0:
             log.warning("Cannot plot utilization as percentage; capacity is 0.")
-            util_data = [0.0] * len(busy_counts)
-        else:
-            # Convert absolute counts to percentages
-            util_data = [count / measure.capacity for count in busy_counts]
+
+        # Convert absolute counts to percentages in one vectorized
+        # divide. With zero capacity, the 'where' mask is False and
+        # the output keeps its zeros.
+        busy_arr = busy_counts.astype(np.float64)
+        util_data = np.divide(busy_arr, measure.capacity,
+                              out=np.zeros_like(busy_arr),
+                              where=(measure.capacity != 0))
         
         y_label = "Server Utilization (%)"
         y_limit = 1.0
-        avg_stats = measure.get_final_kpis(end_time)['server_utilization']
+        avg_stats = _final_kpis(measure)['server_utilization']
         avg_line_val = avg_stats['average_utilization_percentage']
         avg_label = f"Time-Avg Utilization: {avg_line_val:.1%}"
 
@@ -278,12 +371,12 @@ def plot_server_utilization_over_time(
         util_data = busy_counts
         y_label = "Busy Servers (Count)"
         y_limit = measure.capacity or 1.0 # Set reasonable upper limit
-        avg_stats = measure.get_final_kpis(end_time)['server_utilization']
+        avg_stats = _final_kpis(measure)['server_utilization']
         avg_line_val = avg_stats['time_weighted_average_busy_servers']
         avg_label = f"Time-Avg Busy: {avg_line_val:.2f}"
 
     # Draw the main step plot
-    ax.step(times, util_data, where='post')
+    _plot_steps(ax, times, util_data)
 
     # Draw the time-weighted average line
     ax.axhline(
@@ -301,6 +394,7 @@ def plot_server_utilization_over_time(
     
     # If plotting percentage, format the y-axis ticks
     if as_percentage:
+        from matplotlib.ticker import PercentFormatter
         ax.yaxis.set_major_formatter(PercentFormatter(1.0))
 
     ax.legend()
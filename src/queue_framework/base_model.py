@@ -27,8 +27,15 @@ class BaseQueueModel(abc.ABC):
 
     A concrete implementation (e.g., FIFOQueueModel) must inherit from
     this class and implement all its abstract methods.
+
+    The base attributes are stored in `__slots__`. A subclass that
+    wants the same compact, dict-free layout must declare its own
+    `__slots__` for the attributes it adds; otherwise its instances
+    silently get a `__dict__` back.
     """
 
+    __slots__ = ("capacity", "start_time")
+
     def __init__(self, capacity: int, start_time: float = 0.0):
         """
         Initializes the base attributes common to all queue models.
@@ -62,6 +69,11 @@ class BaseQueueModel(abc.ABC):
 
         Args:
             entity (Any): The entity (e.g., User, Car) requesting service.
+                          It must have a writable `.state` attribute,
+                          which the model keeps set to the entity's
+                          current EntityState. If it cannot be
+                          written, the AttributeError is raised
+                          before the model's own state changes.
             current_time (float): The current simulation time.
 
         Returns:
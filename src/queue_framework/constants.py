@@ -7,11 +7,34 @@ This module provides abstract, generalized constants to define the state
 of entities and the results of operations within the queueing model.
 These enums act as a clean interface, ensuring the framework remains
 domain-agnostic.
+
+NOTE: Both enums are `IntEnum`s, so their members compare
+and hash as plain integers (e.g., `RequestResult.QUEUED == 2`).
+Code relying on members *not* being instances of `int` should be
+updated. Their `str()` and f-string output is unchanged
+(e.g., "RequestResult.QUEUED").
 """
 
-from enum import Enum, auto
+from enum import Enum, IntEnum, auto
+
+
+class _NamedIntEnum(IntEnum):
+    """
+    An IntEnum that keeps the plain Enum text representation.
+
+    By default, `str()` and `format()` of an IntEnum member return its
+    integer value on recent Python versions. We keep "Class.MEMBER" so
+    that logs and printed results stay readable.
+    """
+
+    def __str__(self) -> str:
+        return Enum.__str__(self)
+
+    def __format__(self, format_spec: str) -> str:
+        return format(str(self), format_spec)
+
 
-class EntityState(Enum):
+class EntityState(_NamedIntEnum):
     """
     Represents the standardized states an entity can be in
     relative to a queueing model.
@@ -35,7 +58,7 @@ class EntityState(Enum):
     # TODO: Consider adding more states in the future, such as:
     # REJECTED = auto()
 
-class RequestResult(Enum):
+class RequestResult(_NamedIntEnum):
     """
     Represents the possible outcomes of an entity's `request` for a resource.
     
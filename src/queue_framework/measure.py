@@ -14,11 +14,33 @@ when its 'log_...' methods are called by the QueueModel.
 
 import logging
 import math
-from typing import List, Tuple, Dict, Any, Optional
+from array import array
+from itertools import repeat
+from typing import List, Tuple, Dict, Any, Optional, Sequence
+
+# Optional Dependency Handling
+# NumPy is NOT a dependency of the core framework. If it happens to be
+# installed, it is used to speed up the end-of-run KPI reductions;
+# otherwise the same statistics are computed in pure Python.
+# If Numba is installed too, the compiled kernels in _kernels are
+# preferred over both.
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from . import _kernels
+from .report import (
+    KPIReport, SimulationSummary, ArrivalsAndThroughput, StatsBlock,
+    QueueLengthStats, ServerUtilizationStats
+)
 
 # Set up the module-level logger
 log = logging.getLogger(__name__)
 
+# Z-score of the two-sided 95% confidence interval
+_Z95 = 1.96
+
 from enum import Enum  # [NUOVA AGGIUNTA]
 
 # [NUOVA AGGIUNTA]
@@ -32,6 +54,24 @@ class BinningInterval(Enum):
     WEEK = DAY * 7.0
 
 
+def _series_property(slot: str, doc: str) -> property:
+    """
+    Builds the public property of a data series stored in 'slot'.
+
+    Reading returns the stored buffer itself; assigning a new series
+    also bumps the tracker's mutation counter, so the memoized KPI
+    report is recomputed.
+    """
+    def fget(self):
+        return getattr(self, slot)
+
+    def fset(self, data):
+        setattr(self, slot, data)
+        self._version += 1
+
+    return property(fget, fset, doc=doc)
+
+
 class Measure:
     """
     Collects, stores, and calculates KPIs for a queueing system.
@@ -47,25 +87,73 @@ class Measure:
                             initialized.
         
         # Observation-based data lists
-        wait_times (List[float]): A list of all wait times recorded.
-        service_times (List[float]): A list of all service times recorded.
-        system_times (List[float]): A list of all total system sojourn times
+        wait_times (array.array): All wait times recorded
+                                  (a packed array of doubles).
+        service_times (array.array): All service times recorded.
+        system_times (array.array): All total system sojourn times
                                    (wait + service).
         
-        # Time-weighted data logs
+        # Time-weighted data logs (stored as parallel packed arrays)
+        queue_length_times (array.array): Timestamps of queue length
+                                          changes (doubles).
+        queue_length_values (array.array): The new queue length at each
+                                           timestamp (64-bit ints).
+        server_busy_times (array.array): Timestamps of busy-server changes.
+        server_busy_values (array.array): The new busy server count at
+                                          each timestamp.
         queue_length_log (List[Tuple[float, int]]): 
-            A log of (timestamp, new_queue_length) tuples.
+            A (timestamp, new_queue_length) view of the queue series.
         server_busy_log (List[Tuple[float, int]]):
-            A log of (timestamp, new_busy_server_count) tuples.
+            A (timestamp, new_busy_server_count) view of the server series.
 
         # Simple counters
         total_arrivals (int): Total number of entities that arrived.
         total_waited (int): Total number of entities that had to wait (wait > 0).
         total_served (int): Total number of entities that completed service.
+        max_queue_length (int): The longest queue observed so far.
         
         last_update_time (float): The timestamp of the last logged event.
+                                  Events are expected in non-decreasing
+                                  time order, as a DES produces them
+                                  (asserted by the log_* methods unless
+                                  Python runs with -O).
     """
 
+    # Every log_* call touches several of these attributes, so they
+    # are stored in slots rather than in a per-instance __dict__.
+    __slots__ = (
+        "capacity", "start_time", "last_update_time",
+        "_wait_times", "_service_times", "_system_times",
+        "_queue_length_times", "_queue_length_values",
+        "_server_busy_times", "_server_busy_values",
+        "total_arrivals", "total_waited", "total_served",
+        "max_queue_length", "_version", "_kpi_cache",
+        # Binning
+        "bin_size", "current_bin_index",
+        "binned_wait_time", "binned_system_time",
+        "binned_queue_length", "binned_server_utilization",
+        "_temp_bin_wait_times", "_temp_bin_system_times",
+        "_temp_bin_queue_log", "_temp_bin_server_log",
+        "_last_queue_state", "_last_server_state",
+    )
+
+    # Public data series (see the class docstring). The log_* methods
+    # append to the slots directly; assigning a series goes through
+    # the property so that the memoized report is invalidated.
+    wait_times = _series_property("_wait_times", "All wait times recorded.")
+    service_times = _series_property("_service_times",
+                                     "All service times recorded.")
+    system_times = _series_property("_system_times",
+                                    "All system sojourn times recorded.")
+    queue_length_times = _series_property(
+        "_queue_length_times", "Timestamps of queue length changes.")
+    queue_length_values = _series_property(
+        "_queue_length_values", "Queue length at each timestamp.")
+    server_busy_times = _series_property(
+        "_server_busy_times", "Timestamps of busy-server changes.")
+    server_busy_values = _series_property(
+        "_server_busy_values", "Busy server count at each timestamp.")
+
     def __init__(self, capacity: int, start_time: float = 0.0, 
                  # [NUOVA AGGIUNTA] Parametri per il binning
                  bin_interval: Optional[BinningInterval] = BinningInterval.HOUR):
@@ -89,21 +177,43 @@ class Measure:
         self.last_update_time: float = start_time
 
         # Data Storage
-        # Observation-based lists
-        self.wait_times: List[float] = []
-        self.service_times: List[float] = []
-        self.system_times: List[float] = []
+        # Observation-based lists. Stored as packed arrays of C doubles
+        # (8 bytes per sample instead of one boxed float object each),
+        # which NumPy can also read without copying.
+        self._wait_times: "array[float]" = array("d")
+        self._service_times: "array[float]" = array("d")
+        self._system_times: "array[float]" = array("d")
 
         # Time-weighted logs. Add initial state at start_time to
         # "anchor" the time-weighted calculations.
-        self.queue_length_log: List[Tuple[float, int]] = [(start_time, 0)]
-        self.server_busy_log: List[Tuple[float, int]] = [(start_time, 0)]
+        # Each log is kept as two parallel series (timestamps, values)
+        # rather than a list of tuples: no tuple is allocated per event,
+        # and consumers (e.g., plotting) can read each series directly.
+        # Both series are packed arrays, so logging an event is two
+        # C-level appends and the data stays compact.
+        self._queue_length_times: "array[float]" = array("d", [start_time])
+        self._queue_length_values: "array[int]" = array("q", [0])
+        self._server_busy_times: "array[float]" = array("d", [start_time])
+        self._server_busy_values: "array[int]" = array("q", [0])
 
         # Simple counters
         self.total_arrivals: int = 0
         self.total_waited: int = 0
         self.total_served: int = 0
 
+        # Running maximum of the queue length series. Only
+        # log_queue_entry() can grow the queue, so it is kept up to
+        # date there instead of scanning the log at report time.
+        self.max_queue_length: int = 0
+
+        # Mutation counter: bumped by every log_* call, reset() and
+        # every assignment of a data series (see _series_property).
+        self._version: int = 0
+
+        # Last KPIReport, as (fingerprint, report). See
+        # _kpi_fingerprint() for what invalidates it.
+        self._kpi_cache: Optional[Tuple[Tuple, KPIReport]] = None
+
         # === [NUOVA AGGIUNTA] Sezione per il Binning ===
         self.bin_size: Optional[float] = bin_interval.value if bin_interval else None
         self.current_bin_index: int = 0
@@ -135,6 +245,100 @@ class Measure:
                   f"StartTime={start_time})")
         
     
+    def reset(self, start_time: float = 0.0):
+        """
+        Clears all collected data so the tracker can be reused, e.g.
+        for the next replication of a simulation.
+
+        The existing buffers are emptied in place rather than
+        replaced, so a warm tracker reuses its memory.
+
+        Args:
+            start_time (float, optional): The simulation time at which
+                                          tracking restarts. Defaults to 0.0.
+        """
+        self.start_time = start_time
+        self.last_update_time = start_time
+        self._version += 1
+
+        del self._wait_times[:]
+        del self._service_times[:]
+        del self._system_times[:]
+
+        # Re-anchor the time-weighted logs at the new start time
+        for times, values in ((self._queue_length_times, self._queue_length_values),
+                              (self._server_busy_times, self._server_busy_values)):
+            del times[:]
+            del values[:]
+            times.append(start_time)
+            values.append(0)
+
+        self.total_arrivals = 0
+        self.total_waited = 0
+        self.total_served = 0
+        self.max_queue_length = 0
+
+        self._kpi_cache = None
+
+        # Binning state
+        self.current_bin_index = 0
+        del self.binned_wait_time[:]
+        del self.binned_system_time[:]
+        del self.binned_queue_length[:]
+        del self.binned_server_utilization[:]
+        if self.bin_size is not None:
+            del self._temp_bin_wait_times[:]
+            del self._temp_bin_system_times[:]
+            del self._temp_bin_queue_log[:]
+            del self._temp_bin_server_log[:]
+            self._last_queue_state = 0
+            self._last_server_state = 0
+
+        log.debug(f"Measure tracker reset (StartTime={start_time})")
+
+    @property
+    def mean_wait_time(self) -> float:
+        """The mean of all recorded wait times (0.0 if none)."""
+        return self._mean(self._wait_times)
+
+    @property
+    def mean_system_time(self) -> float:
+        """The mean of all recorded system times (0.0 if none)."""
+        return self._mean(self._system_times)
+
+    @staticmethod
+    def _mean(data: Sequence[float]) -> float:
+        """
+        Returns the mean of an observation list (0.0 if empty).
+
+        This is much cheaper than building the full report with
+        get_final_kpis() when only one mean is needed.
+        """
+        return (sum(data) / len(data)) if data else 0.0
+
+    @property
+    def queue_length_log(self) -> List[Tuple[float, int]]:
+        """The queue length log as a list of (timestamp, value) tuples."""
+        return list(zip(self._queue_length_times, self._queue_length_values))
+
+    @queue_length_log.setter
+    def queue_length_log(self, log_data: List[Tuple[float, int]]):
+        self._queue_length_times = array("d", (time for time, _ in log_data))
+        self._queue_length_values = array("q", (value for _, value in log_data))
+        self._version += 1
+        self.max_queue_length = max(self._queue_length_values, default=0)
+
+    @property
+    def server_busy_log(self) -> List[Tuple[float, int]]:
+        """The busy-server log as a list of (timestamp, value) tuples."""
+        return list(zip(self._server_busy_times, self._server_busy_values))
+
+    @server_busy_log.setter
+    def server_busy_log(self, log_data: List[Tuple[float, int]]):
+        self._server_busy_times = array("d", (time for time, _ in log_data))
+        self._server_busy_values = array("q", (value for _, value in log_data))
+        self._version += 1
+
     # === [NUOVA AGGIUNTA] Metodi Helper per il Binning ===
 
     def _check_and_update_bins(self, current_time: float):
@@ -256,29 +460,43 @@ class Measure:
 
     def log_arrival(self, time: float):
         """Logs the arrival of a new entity."""
+        assert time >= self.last_update_time, (
+            f"Events must be logged in time order: T={time} is before "
+            f"the last event at T={self.last_update_time}")
         self._check_and_update_bins(time)  # [NUOVA AGGIUNTA]
         self.total_arrivals += 1
-        self._update_last_time(time)
-        log.debug(f"T={time:.2f}: Entity arrival logged. "
-                  f"Total arrivals: {self.total_arrivals}")
+        self.last_update_time = time
+        self._version += 1
+        log.debug("T=%.2f: Entity arrival logged. Total arrivals: %d",
+                  time, self.total_arrivals)
 
     def log_queue_entry(self, time: float, current_queue_length: int):
         """Logs an entity entering the queue."""
+        assert time >= self.last_update_time, (
+            f"Events must be logged in time order: T={time} is before "
+            f"the last event at T={self.last_update_time}")
         self._check_and_update_bins(time)  # [NUOVA AGGIUNTA]
         # [NUOVA AGGIUNTA] Log per il binning
         if self.bin_size is not None:
             self._temp_bin_queue_log.append((time, current_queue_length))
 
         self.total_waited += 1
-        self.queue_length_log.append((time, current_queue_length))
-        self._update_last_time(time)
-        log.debug(f"T={time:.2f}: Entity queued. "
-                  f"New queue length: {current_queue_length}")
+        self._queue_length_times.append(time)
+        self._queue_length_values.append(current_queue_length)
+        if current_queue_length > self.max_queue_length:
+            self.max_queue_length = current_queue_length
+        self.last_update_time = time
+        self._version += 1
+        log.debug("T=%.2f: Entity queued. New queue length: %d",
+                  time, current_queue_length)
         
     def log_service_start(self, time: float, wait_time: float,
                           current_queue_length: int,
                           current_busy_servers: int):
         """Logs an entity starting service (after 0 or more wait)."""
+        assert time >= self.last_update_time, (
+            f"Events must be logged in time order: T={time} is before "
+            f"the last event at T={self.last_update_time}")
         self._check_and_update_bins(time)  # [NUOVA AGGIUNTA]
         
         # [NUOVA AGGIUNTA] Log per il binning
@@ -287,19 +505,60 @@ class Measure:
             self._temp_bin_queue_log.append((time, current_queue_length))
             self._temp_bin_server_log.append((time, current_busy_servers))
 
-        self.wait_times.append(wait_time)
+        self._wait_times.append(wait_time)
         
         # Log state changes
-        self.queue_length_log.append((time, current_queue_length))
-        self.server_busy_log.append((time, current_busy_servers))
-        self._update_last_time(time)
-        log.debug(f"T={time:.2f}: Entity service started. "
-                  f"Wait: {wait_time:.2f}, Q_len: {current_queue_length}, "
-                  f"Busy: {current_busy_servers}")
+        self._queue_length_times.append(time)
+        self._queue_length_values.append(current_queue_length)
+        self._server_busy_times.append(time)
+        self._server_busy_values.append(current_busy_servers)
+        self.last_update_time = time
+        self._version += 1
+        log.debug("T=%.2f: Entity service started. "
+                  "Wait: %.2f, Q_len: %d, Busy: %d",
+                  time, wait_time, current_queue_length,
+                  current_busy_servers)
+
+    def log_service_starts(self, time: float, wait_times: Sequence[float],
+                           queue_lengths: Sequence[int],
+                           busy_servers: Sequence[int]):
+        """
+        Logs several entities starting service at the same time.
+
+        Equivalent to calling log_service_start() once per entity with
+        the matching items of the three sequences, but every series
+        is extended in one call.
+        """
+        assert time >= self.last_update_time, (
+            f"Events must be logged in time order: T={time} is before "
+            f"the last event at T={self.last_update_time}")
+        if not wait_times:
+            return
+        self._check_and_update_bins(time)
+
+        if self.bin_size is not None:
+            self._temp_bin_wait_times.extend(wait_times)
+            self._temp_bin_queue_log.extend(
+                (time, length) for length in queue_lengths)
+            self._temp_bin_server_log.extend(
+                (time, busy) for busy in busy_servers)
+
+        n = len(wait_times)
+        self._wait_times.extend(wait_times)
+        self._queue_length_times.extend(repeat(time, n))
+        self._queue_length_values.extend(queue_lengths)
+        self._server_busy_times.extend(repeat(time, n))
+        self._server_busy_values.extend(busy_servers)
+        self.last_update_time = time
+        self._version += 1
+        log.debug("T=%.2f: %d entity service starts logged.", time, n)
 
     def log_service_end(self, time: float, service_time: float, 
                         system_time: float, current_busy_servers: int):
         """Logs an entity finishing service."""
+        assert time >= self.last_update_time, (
+            f"Events must be logged in time order: T={time} is before "
+            f"the last event at T={self.last_update_time}")
         self._check_and_update_bins(time)  # [NUOVA AGGIUNTA]
         
         # [NUOVA AGGIUNTA] Log per il binning
@@ -307,25 +566,23 @@ class Measure:
             self._temp_bin_system_times.append(system_time)
             self._temp_bin_server_log.append((time, current_busy_servers))
 
-        self.service_times.append(service_time)
-        self.system_times.append(system_time)
+        self._service_times.append(service_time)
+        self._system_times.append(system_time)
         self.total_served += 1
         
         # Log state change
-        self.server_busy_log.append((time, current_busy_servers))
-        self._update_last_time(time)
-        log.debug(f"T={time:.2f}: Entity service ended. "
-                  f"Service time: {service_time:.2f}, "
-                  f"Busy: {current_busy_servers}")
+        self._server_busy_times.append(time)
+        self._server_busy_values.append(current_busy_servers)
+        self.last_update_time = time
+        self._version += 1
+        log.debug("T=%.2f: Entity service ended. "
+                  "Service time: %.2f, Busy: %d",
+                  time, service_time, current_busy_servers)
         
     
 
-    def _update_last_time(self, time: float):
-        """Internal helper to keep track of the latest event time."""
-        self.last_update_time = max(self.last_update_time, time)
-
     def _calculate_statistical_summary(
-        self, data: List[float], confidence: float = 0.95
+        self, data: Sequence[float]
     ) -> Dict[str, Any]:
         """
         Calculates a full statistical summary for a list of observations.
@@ -341,34 +598,38 @@ class Measure:
                 "confidence_interval_95": (0.0, 0.0)
             }
 
-        mean = sum(data) / n
-        
-        if n > 1:
-            variance = sum((x - mean) ** 2 for x in data) / (n - 1)
+        if _kernels.HAVE_NUMBA and np is not None:
+            # Compiled single pass for both mean and variance.
+            mean, variance = _kernels.welford(
+                np.asarray(data, dtype=np.float64))
             std_dev = math.sqrt(variance)
+        elif np is not None:
+            # Vectorized reductions (run in C, no per-sample Python work).
+            # For the array-backed observation lists this is a zero-copy
+            # view through the buffer protocol.
+            arr = np.asarray(data, dtype=np.float64)
+            mean = float(arr.mean())
+            std_dev = float(arr.std(ddof=1)) if n > 1 else 0.0
         else:
-            std_dev = 0.0 # Cannot calculate variance with one sample
+            mean = sum(data) / n
+            
+            if n > 1:
+                variance = sum((x - mean) ** 2 for x in data) / (n - 1)
+                std_dev = math.sqrt(variance)
+            else:
+                std_dev = 0.0 # Cannot calculate variance with one sample
 
         # --- Calculate Confidence Interval ---
         # Using Z-score for simplicity, which is a good approximation
         # for n > 30.
         # TODO: Could be extended to use t-distribution for smaller n
-        
-        z_score = 1.96  # For 95% confidence
-        if confidence != 0.95:
-            # This is a placeholder. A real implementation would use
-            # a lookup table or math.erf to find other Z-scores.
-            log.warning(f"CI calculation for confidence {confidence} "
-                        "not implemented, defaulting to 95% (Z=1.96).")
-            
-        if n > 0:
-            margin_of_error = z_score * (std_dev / math.sqrt(n))
+        if n > 1:
+            margin_of_error = _Z95 * (std_dev / math.sqrt(n))
             ci_low = mean - margin_of_error
             ci_high = mean + margin_of_error
         else:
-            margin_of_error = 0.0
-            ci_low = 0.0
-            ci_high = 0.0
+            # A single sample has no spread (n == 0 returned above)
+            ci_low = ci_high = mean
 
         return {
             "mean": mean,
@@ -378,25 +639,45 @@ class Measure:
         }
 
     def _calculate_time_weighted_average(
-        self, log_data: List[Tuple[float, int]], total_duration: float
+        self, times: Sequence[float], values: Sequence[int],
+        total_duration: float
     ) -> float:
         """
         Calculates the time-weighted average for a state variable.
         
         This computes the integral of (value * time_duration) over the
         total simulation, then divides by the total duration.
+
+        Args:
+            times (Sequence[float]): Timestamps of the state changes.
+            values (Sequence[int]): The new value at each timestamp.
+            total_duration (float): The total simulated duration.
         """
-        if total_duration == 0:
+        if total_duration == 0 or len(times) == 0:
             return 0.0
-        
-        integral = 0.0
-        last_time, last_value = self.start_time, 0
-        
-        # Use the provided log, starting from the initial state
-        for time, value in log_data:
-            duration = time - last_time
-            integral += last_value * duration
-            last_time, last_value = time, value
+
+        if _kernels.HAVE_NUMBA and np is not None:
+            return _kernels.time_weighted_average(
+                np.asarray(times, dtype=np.float64),
+                np.asarray(values, dtype=np.float64),
+                self.start_time, total_duration)
+
+        if np is not None:
+            # Vectorized integral: each value is held until the next
+            # timestamp, i.e. dot(values[:-1], diff(times)).
+            times_arr = np.asarray(times, dtype=np.float64)
+            values_arr = np.asarray(values, dtype=np.float64)
+            integral = float(np.dot(values_arr[:-1], np.diff(times_arr)))
+            last_time, last_value = float(times_arr[-1]), values[-1]
+        else:
+            integral = 0.0
+            last_time, last_value = self.start_time, 0
+            
+            # Use the provided log, starting from the initial state
+            for time, value in zip(times, values):
+                duration = time - last_time
+                integral += last_value * duration
+                last_time, last_value = time, value
             
         # Add the final interval (from last event to end of simulation)
         final_duration = total_duration - (last_time - self.start_time)
@@ -412,6 +693,8 @@ class Measure:
         Calculates and returns the final dictionary of all KPIs.
 
         This method should be called *after* the simulation is complete.
+        It is the dictionary form of get_kpi_report(); each call returns
+        a fresh dictionary that the caller is free to modify.
 
         Args:
             simulation_end_time (Optional[float]): The final timestamp
@@ -421,6 +704,31 @@ class Measure:
         Returns:
             Dict[str, Any]: A nested dictionary containing all KPIs.
         """
+        report = self.get_kpi_report(simulation_end_time)
+        if report is None:
+            return {"error": "Total duration is 0"}
+        return report.to_dict()
+
+    def get_kpi_report(self, simulation_end_time: Optional[float] = None
+                       ) -> Optional[KPIReport]:
+        """
+        Calculates and returns the final KPI report as a KPIReport.
+
+        The report is memoized: as long as no new event is logged (and
+        no data series is reassigned), later calls with the same end
+        time return the same (shared) object, so it should be treated
+        as read-only. Series edited in place by the caller are not
+        detected; assign a new series instead.
+
+        Args:
+            simulation_end_time (Optional[float]): The final timestamp
+                of the simulation. If not provided, uses the time of the
+                last recorded event.
+
+        Returns:
+            Optional[KPIReport]: The report, or None if the total
+                                 simulated duration is not positive.
+        """
         if simulation_end_time is None:
             end_time = self.last_update_time
             log.warning(f"simulation_end_time not provided to "
@@ -432,7 +740,12 @@ class Measure:
         total_duration = end_time - self.start_time
         if total_duration <= 0:
             log.warning("Total simulation duration is 0. Returning empty stats.")
-            return {"error": "Total duration is 0"}
+            return None
+
+        # Reuse the last report if nothing was logged since
+        fingerprint = self._kpi_fingerprint(end_time)
+        if self._kpi_cache is not None and self._kpi_cache[0] == fingerprint:
+            return self._kpi_cache[1]
 
         log.info(f"Calculating final KPIs for total duration: "
                  f"{total_duration:.2f} (from {self.start_time:.2f} "
@@ -440,18 +753,19 @@ class Measure:
 
         
         # Observation-based stats
-        wait_stats = self._calculate_statistical_summary(self.wait_times)
-        service_stats = self._calculate_statistical_summary(self.service_times)
-        system_stats = self._calculate_statistical_summary(self.system_times)
+        wait_stats = self._calculate_statistical_summary(self._wait_times)
+        service_stats = self._calculate_statistical_summary(self._service_times)
+        system_stats = self._calculate_statistical_summary(self._system_times)
         
         # Time-weighted stats
         avg_queue_length = self._calculate_time_weighted_average(
-            self.queue_length_log, total_duration)
-        max_queue_length = max(val for _, val in self.queue_length_log) \
-            if self.queue_length_log else 0
+            self._queue_length_times, self._queue_length_values,
+            total_duration)
+        max_queue_length = self.max_queue_length
         
         avg_servers_busy = self._calculate_time_weighted_average(
-            self.server_busy_log, total_duration)
+            self._server_busy_times, self._server_busy_values,
+            total_duration)
         
         # Simple ratios
         avg_utilization = (avg_servers_busy / self.capacity) \
@@ -461,31 +775,46 @@ class Measure:
             if self.total_arrivals > 0 else 0.0
 
         # Assemble Final Report
-        return {
-            "simulation_summary": {
-                "start_time": self.start_time,
-                "end_time": end_time,
-                "total_duration": total_duration,
-                "total_capacity": self.capacity
-            },
-            "arrivals_and_throughput": {
-                "total_arrivals": self.total_arrivals,
-                "total_served": self.total_served,
-                "total_who_waited": self.total_waited,
-                "probability_of_waiting": prob_wait
-            },
-            "wait_time": wait_stats,
-            "service_time": service_stats,
-            "system_time": system_stats,
-            "queue_length": {
-                "time_weighted_average": avg_queue_length,
-                "max_observed": max_queue_length
-            },
-            "server_utilization": {
-                "time_weighted_average_busy_servers": avg_servers_busy,
-                "average_utilization_percentage": avg_utilization
-            }
-        }
+        report = KPIReport(
+            simulation_summary=SimulationSummary(
+                start_time=self.start_time,
+                end_time=end_time,
+                total_duration=total_duration,
+                total_capacity=self.capacity
+            ),
+            arrivals_and_throughput=ArrivalsAndThroughput(
+                total_arrivals=self.total_arrivals,
+                total_served=self.total_served,
+                total_who_waited=self.total_waited,
+                probability_of_waiting=prob_wait
+            ),
+            wait_time=StatsBlock(**wait_stats),
+            service_time=StatsBlock(**service_stats),
+            system_time=StatsBlock(**system_stats),
+            queue_length=QueueLengthStats(
+                time_weighted_average=avg_queue_length,
+                max_observed=max_queue_length
+            ),
+            server_utilization=ServerUtilizationStats(
+                time_weighted_average_busy_servers=avg_servers_busy,
+                average_utilization_percentage=avg_utilization
+            )
+        )
+        self._kpi_cache = (fingerprint, report)
+        return report
+
+    def _kpi_fingerprint(self, end_time: float) -> Tuple:
+        """
+        Returns a key identifying the data behind a final KPI report.
+
+        Every log_* call, reset() and every assignment of a data series
+        bumps the mutation counter; the scalar attributes are compared
+        by value. An unchanged key therefore means an unchanged report,
+        unless a series was edited in place by the caller.
+        """
+        return (end_time, self._version, self.start_time, self.capacity,
+                self.last_update_time, self.total_arrivals,
+                self.total_waited, self.total_served)
 
     # === [NUOVA AGGIUNTA] Metodo Getter per i Dati Binned ===
     
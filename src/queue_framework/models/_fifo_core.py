@@ -0,0 +1,178 @@
+# src/queue_framework/models/_fifo_core.py
+
+"""
+Shared state handling of the FIFO-based queue models.
+
+`FIFOQueueModel` and `FiniteCapacityModel` only differ in how they
+admit an arriving entity; releasing a resource, serving the next
+waiting entity, and the bookkeeping behind both are identical. That
+common part lives in the `_FIFOCore` mixin defined here, so there is
+a single copy of the per-event code.
+"""
+
+import logging
+from collections import deque
+from typing import Any, Optional, Dict, Deque, KeysView, List, Tuple
+
+# Local package imports
+from ..constants import EntityState
+from ..measure import Measure
+
+# Set up the module-level logger
+log = logging.getLogger(__name__)
+
+
+class _FIFOCore:
+    """
+    Mixin implementing the FIFO waiting line, the in-service records,
+    `release()` and `reset()`.
+
+    It must come *before* `BaseQueueModel` in the bases of a model
+    (so that its `release` overrides the abstract one), and the model
+    must list the attributes set by `_init_fifo_state()` in its own
+    `__slots__`.
+    """
+
+    __slots__ = ()
+
+    def _init_fifo_state(self, capacity: int, start_time: float):
+        """Creates the queue, the in-service records and the tracker."""
+        # Use deques for O(1) FIFO operations: waiting entities and
+        # their arrival times, kept in lockstep (no per-entity tuple).
+        self._q_entities: Deque[Any] = deque()
+        self._q_arrivals: Deque[float] = deque()
+
+        # Per-entity timing records live in a fixed pool of
+        # [arrival_time, service_start_time] slots. Only entities in
+        # service hold a slot, so `capacity` slots are always enough;
+        # freed indices are recycled through the `_free` stack.
+        self._slots: List[List[float]] = [[0.0, 0.0] for _ in range(capacity)]
+        self._free: List[int] = list(range(capacity))
+        # Entities in service -> slot index.
+        # Being a key here is what "holding a resource" means.
+        self._active: Dict[Any, int] = {}
+
+        # Components
+        self.kpi_tracker: Measure = Measure(capacity, start_time)
+
+    @property
+    def queue(self) -> List[Tuple[Any, float]]:
+        """Snapshot of the waiting line as (entity, arrival_time) pairs."""
+        return list(zip(self._q_entities, self._q_arrivals))
+
+    @property
+    def users(self) -> KeysView:
+        """Read-only view of the entities currently in service."""
+        return self._active.keys()
+
+    def release(self, entity: Any, current_time: float) -> Optional[Any]:
+        """
+        An entity releases a resource. If the queue is not empty,
+        the next entity (FIFO) is dequeued and served.
+        """
+        log.debug("T=%.2f: Release by entity %s...", current_time, entity)
+
+        if entity not in self._active:
+            log.error(f"T={current_time:.2f}: Entity {entity} tried to "
+                      f"release a resource it does not possess.")
+            raise ValueError(f"Entity {entity} not in active users set.")
+
+        # Update State first: if it fails, the model is unchanged
+        self._set_entity_state(entity, EntityState.IDLE)
+
+        # Log KPIs for the departing entity
+        slot_idx = self._active.pop(entity)
+        arrival_time, service_start_time = self._slots[slot_idx]
+        self._free.append(slot_idx)
+        service_time = current_time - service_start_time
+        system_time = current_time - arrival_time
+
+        n_users = len(self._active)
+
+        self.kpi_tracker.log_service_end(
+            time=current_time,
+            service_time=service_time,
+            system_time=system_time,
+            current_busy_servers=n_users
+        )
+
+        log.debug("T=%.2f: Entity %s released resource. ServiceTime=%.2f",
+                  current_time, entity, service_time)
+
+        # Check Queue for Next Entity
+        if self._q_entities:
+            # FIFO logic: pop from the left
+            next_entity = self._q_entities.popleft()
+            next_arrival_time = self._q_arrivals.popleft()
+
+            log.debug("T=%.2f: Queue not empty. Serving next entity %s (FIFO).",
+                      current_time, next_entity)
+
+            # Set its state to IN_SERVICE (it accepted a state write
+            # when it was queued, so this is not expected to fail)
+            self._set_entity_state(next_entity, EntityState.IN_SERVICE)
+            self._serve_entity(entity=next_entity,
+                               arrival_time=next_arrival_time,
+                               start_time=current_time,
+                               n_users=n_users + 1,
+                               n_queue=len(self._q_entities))
+            return next_entity
+
+        else:
+            log.debug("T=%.2f: Resource freed. Queue is empty.", current_time)
+            return None
+
+    def reset(self, start_time: float = 0.0):
+        """
+        Empties the model and its KPI tracker so it can be reused,
+        e.g. for the next replication of a simulation.
+
+        Entities still queued or in service are simply forgotten;
+        their `.state` is left untouched.
+
+        Args:
+            start_time (float, optional): The simulation time at which
+                                          the model restarts. Defaults to 0.0.
+        """
+        self.start_time = start_time
+        self._q_entities.clear()
+        self._q_arrivals.clear()
+        self._active.clear()
+        self._free[:] = range(self.capacity)
+        self.kpi_tracker.reset(start_time)
+
+    def _serve_entity(self, entity: Any, arrival_time: float,
+                      start_time: float, n_users: int, n_queue: int):
+        """
+        Internal helper to record an entity as in service.
+
+        The caller must already have set the entity's state to
+        IN_SERVICE. `n_users` and `n_queue` are the busy-server count
+        (including this entity) and queue length after the move, as
+        already known by the caller.
+        """
+        wait_time = start_time - arrival_time
+
+        slot_idx = self._free.pop()
+        slot = self._slots[slot_idx]
+        slot[0] = arrival_time
+        slot[1] = start_time
+        self._active[entity] = slot_idx
+
+        self.kpi_tracker.log_service_start(
+            time=start_time,
+            wait_time=wait_time,
+            current_queue_length=n_queue,
+            current_busy_servers=n_users
+        )
+
+    def _set_entity_state(self, entity: Any, state: EntityState):
+        """
+        Sets the entity's state attribute.
+
+        Entities must expose a writable `.state` (see
+        BaseQueueModel.request); otherwise the AttributeError
+        propagates to the caller. The models set the state *before*
+        changing their own, so such a failure leaves them untouched.
+        """
+        entity.state = state
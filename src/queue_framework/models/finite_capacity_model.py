@@ -10,19 +10,18 @@ waiting queue is full, the entity is rejected.
 """
 
 import logging
-from collections import deque
-from typing import Any, Optional, Set, Dict, Deque, Tuple
+from typing import Any, Dict
 
 # Local package imports
 from ..base_model import BaseQueueModel
 from ..constants import EntityState, RequestResult
-from ..measure import Measure
+from ._fifo_core import _FIFOCore
 
 # Set up the module-level logger
 log = logging.getLogger(__name__)
 
 
-class FiniteCapacityModel(BaseQueueModel):
+class FiniteCapacityModel(_FIFOCore, BaseQueueModel):
     """
     A concrete implementation of BaseQueueModel for a G/G/c/K system.
     
@@ -32,6 +31,12 @@ class FiniteCapacityModel(BaseQueueModel):
     K = capacity + queue_capacity
     """
 
+    __slots__ = (
+        "queue_capacity", "total_rejections",
+        "_q_entities", "_q_arrivals",
+        "_slots", "_free", "_active", "kpi_tracker",
+    )
+
     def __init__(self, capacity: int, queue_capacity: int,
                  start_time: float = 0.0):
         """
@@ -52,14 +57,8 @@ class FiniteCapacityModel(BaseQueueModel):
             
         self.queue_capacity: int = queue_capacity
         
-        # Internal State Tracking (FIFO-based)
-        self.queue: Deque[Tuple[Any, float]] = deque()
-        self.users: Set[Any] = set()
-        self.entity_arrival_time: Dict[Any, float] = {}
-        self.entity_service_start_time: Dict[Any, float] = {}
-
-        # Components
-        self.kpi_tracker: Measure = Measure(capacity, start_time)
+        # Internal State Tracking and KPI tracker (see _FIFOCore)
+        self._init_fifo_state(capacity, start_time)
         
         # Model-specific KPI
         self.total_rejections: int = 0
@@ -76,38 +75,50 @@ class FiniteCapacityModel(BaseQueueModel):
         An entity requests a resource. It is served, queued, or
         rejected based on server and queue availability.
         """
-        log.debug(f"T={current_time:.2f}: Request from entity {entity}...")
+        log.debug("T=%.2f: Request from entity %s...", current_time, entity)
+
+        # Set the new state first: if the entity has no writable
+        # .state, this raises before the model is changed.
+        # (A rejected entity's state is left unchanged.)
+        n_users = len(self._active)
+        n_queue = len(self._q_entities)
+        if n_users < self.capacity:
+            self._set_entity_state(entity, EntityState.IN_SERVICE)
+        elif n_queue < self.queue_capacity:
+            self._set_entity_state(entity, EntityState.WAITING_FOR_RESOURCE)
         self.kpi_tracker.log_arrival(current_time)
 
         # Check for available server
-        if len(self.users) < self.capacity:
-            # Resource Available
-            log.debug(f"T={current_time:.2f}: Resource available for {entity}.")
+        if n_users < self.capacity:
+            # Resource Available (a free server implies an empty queue)
+            log.debug("T=%.2f: Resource available for %s.", current_time, entity)
             self._serve_entity(entity, 
                                arrival_time=current_time, 
-                               start_time=current_time)
+                               start_time=current_time,
+                               n_users=n_users + 1,
+                               n_queue=0)
             return RequestResult.SERVED_IMMEDIATELY
         
         # Servers are full, check queue capacity
-        if len(self.queue) < self.queue_capacity:
+        if n_queue < self.queue_capacity:
             # Queue has space
-            log.debug(f"T={current_time:.2f}: Resource busy. "
-                      f"Queue has space ({len(self.queue)}/"
-                      f"{self.queue_capacity}). Queuing {entity}.")
+            log.debug("T=%.2f: Resource busy. Queue has space (%d/%d). "
+                      "Queuing %s.", current_time, n_queue,
+                      self.queue_capacity, entity)
             
-            self.queue.append((entity, current_time))
-            self._set_entity_state(entity, EntityState.WAITING_FOR_RESOURCE)
+            self._q_entities.append(entity)
+            self._q_arrivals.append(current_time)
             
             self.kpi_tracker.log_queue_entry(
                 time=current_time,
-                current_queue_length=len(self.queue)
+                current_queue_length=n_queue + 1
             )
             return RequestResult.QUEUED
         
         # Servers are full AND queue is full
-        log.debug(f"T={current_time:.2f}: Resource busy. "
-                  f"Queue is FULL ({len(self.queue)}/"
-                  f"{self.queue_capacity}). REJECTING {entity}.")
+        log.debug("T=%.2f: Resource busy. Queue is FULL (%d/%d). "
+                  "REJECTING %s.", current_time, n_queue,
+                  self.queue_capacity, entity)
         
         self.total_rejections += 1
         # The entity's state remains IDLE (or unchanged).
@@ -115,56 +126,13 @@ class FiniteCapacityModel(BaseQueueModel):
         return RequestResult.REJECTED_QUEUE_FULL
 
 
-    def release(self, entity: Any, current_time: float) -> Optional[Any]:
+    def reset(self, start_time: float = 0.0):
         """
-        An entity releases a resource. This logic is identical to
-        the FIFO model: it frees a resource and serves the next
-        entity from the (FIFO) queue if one is waiting.
+        Empties the model and its KPI tracker so it can be reused,
+        including the rejection counter.
         """
-        log.debug(f"T={current_time:.2f}: Release by entity {entity}...")
-        
-        if entity not in self.users:
-            log.error(f"T={current_time:.2f}: Entity {entity} tried to "
-                      f"release a resource it does not possess.")
-            raise ValueError(f"Entity {entity} not in active users set.")
-
-        # Log KPIs for the departing entity
-        service_start_time = self.entity_service_start_time.pop(entity)
-        arrival_time = self.entity_arrival_time.pop(entity)
-        service_time = current_time - service_start_time
-        system_time = current_time - arrival_time
-        
-        # Update State
-        self.users.remove(entity)
-        self._set_entity_state(entity, EntityState.IDLE)
-
-        self.kpi_tracker.log_service_end(
-            time=current_time,
-            service_time=service_time,
-            system_time=system_time,
-            current_busy_servers=len(self.users)
-        )
-        
-        log.debug(f"T={current_time:.2f}: Entity {entity} "
-                  f"released resource. ServiceTime={service_time:.2f}")
-
-        # Check Queue for Next Entity
-        if len(self.queue) > 0:
-            # FIFO logic: pop from the left
-            next_entity, next_arrival_time = self.queue.popleft()
-            
-            log.debug(f"T={current_time:.2f}: Queue not empty. "
-                      f"Serving next entity {next_entity} (FIFO).")
-            
-            self._serve_entity(entity=next_entity,
-                               arrival_time=next_arrival_time,
-                               start_time=current_time)
-            return next_entity
-        
-        else:
-            log.debug(f"T={current_time:.2f}: Resource freed. "
-                      f"Queue is empty.")
-            return None
+        super().reset(start_time)
+        self.total_rejections = 0
 
     def get_final_kpis(self, simulation_end_time: float) -> Dict[str, Any]:
         """
@@ -187,30 +155,3 @@ class FiniteCapacityModel(BaseQueueModel):
             prob_rejection
 
         return main_kpis
-
-    
-
-    def _serve_entity(self, entity: Any, arrival_time: float,
-                      start_time: float):
-        """Internal helper to move an entity into the IN_SERVICE state."""
-        wait_time = start_time - arrival_time
-        
-        self.users.add(entity)
-        self.entity_arrival_time[entity] = arrival_time
-        self.entity_service_start_time[entity] = start_time
-        self._set_entity_state(entity, EntityState.IN_SERVICE)
-
-        self.kpi_tracker.log_service_start(
-            time=start_time,
-            wait_time=wait_time,
-            current_queue_length=len(self.queue),
-            current_busy_servers=len(self.users)
-        )
-    
-    def _set_entity_state(self, entity: Any, state: EntityState):
-        """Safely sets the entity's state attribute."""
-        try:
-            entity.state = state
-        except AttributeError:
-            log.warning(f"Entity {entity} does not have a '.state' "
-                        f"attribute or it is not mutable.")
\ No newline at end of file
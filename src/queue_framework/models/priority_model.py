@@ -4,8 +4,9 @@
 Implements a concrete Priority-based queue model.
 
 This module provides the `PriorityQueueModel` class. It inherits from
-`BaseQueueModel` and uses Python's `heapq` module to manage the
-queue, serving entities with a lower priority number first.
+`BaseQueueModel` and manages the queue as a bucket queue (one FIFO
+`deque` per priority level), serving entities with a lower priority
+number first.
 
 **Key Feature:**
 This class also demonstrates how to extend the framework's KPI
@@ -19,9 +20,9 @@ Entities processed by this model *must* have a `.priority` attribute
 """
 
 import logging
-import heapq
-from typing import Any, Optional, Set, Dict, List, Tuple
-from collections import defaultdict
+from bisect import insort
+from typing import Any, Optional, Dict, Deque, Iterable, KeysView, List, Tuple
+from collections import deque
 
 # Local package imports
 from ..base_model import BaseQueueModel
@@ -55,18 +56,23 @@ class PriorityQueueModel(BaseQueueModel):
 
         # Internal State Tracking (Priority-specific)
 
-        # The queue is a standard list managed by heapq.
-        # It stores tuples: (priority, arrival_time, entity)
-        # This structure ensures sorting by priority, then by arrival
-        # time (FIFO within priority), and avoids comparing entities.
-        self.queue: List[Tuple[float, float, Any]] = []
-
-        self.users: Set[Any] = set()
-        
-        # We need to track the priority of entities in service
-        # to log their service-end KPIs to the correct tracker.
-        self.user_data: Dict[Any, Dict[str, Any]] = {}
-        # Example: {entity: {"priority": 1, "arrival_time": 10.5, ...}}
+        # The queue is a bucket queue: one deque of
+        # (arrival_time, entity) per priority level, which gives FIFO
+        # order within a priority and O(1) enqueue/dequeue. Simulations
+        # use a handful of priority levels, so the non-empty ones are
+        # kept in a small sorted list whose head is served next.
+        # The length of a bucket is that priority's queue length.
+        self._buckets: Dict[Any, Deque[Tuple[float, Any]]] = {}
+        self._active_priorities: List[Any] = []
+        self._qlen: int = 0
+
+        # Entities in service -> (priority, arrival_time,
+        # service_start_time, trackers), where trackers is the
+        # priority's (main, priority) tracker pair, kept so that their
+        # service end is logged without looking it up again. Being a
+        # key here is what "holding a resource" means.
+        self._user_info: Dict[
+            Any, Tuple[Any, float, float, Tuple[Measure, Measure]]] = {}
 
         # KPI Tracking
         
@@ -75,17 +81,49 @@ class PriorityQueueModel(BaseQueueModel):
         self.kpi_tracker: Measure = Measure(capacity, start_time)
 
         # Additional KPI trackers (for priority-specific KPIs)
-        # We use a defaultdict to create new Measure trackers
-        # on-the-fly as new priority levels are encountered.
-        self.priority_kpi_trackers: Dict[Any, Measure] = defaultdict(
-            lambda: Measure(capacity=self.capacity, start_time=self.start_time)
-        )
+        # New Measure trackers are created on-the-fly (see
+        # _get_ptracker) as new priority levels are encountered.
+        self.priority_kpi_trackers: Dict[Any, Measure] = {}
+
+        # (main tracker, priority tracker) per priority level, so
+        # events that both log identically are a loop over one tuple.
+        self._tracker_pairs: Dict[Any, Tuple[Measure, Measure]] = {}
 
         log.info(f"PriorityQueueModel initialized: Capacity={self.capacity}, "
                  f"StartTime={start_time:.2f}")
 
     
 
+    @property
+    def users(self) -> KeysView:
+        """Read-only view of the entities currently in service."""
+        return self._user_info.keys()
+
+    @property
+    def queue(self) -> List[Tuple[float, float, Any]]:
+        """
+        Snapshot of the waiting line as (priority, arrival_time, entity)
+        tuples, in the order they will be served.
+        """
+        return [(priority, arrival_time, entity)
+                for priority in self._active_priorities
+                for arrival_time, entity in self._buckets[priority]]
+
+    def register_priorities(self, priorities: Iterable[Any]):
+        """
+        Declares the priority levels up front, when they are known
+        before the simulation starts.
+
+        Their KPI trackers and queue buckets are created now instead
+        of on the first arrival of each level, so `request()` never
+        has to allocate them mid-run. Registered levels appear in the
+        priority breakdown even if no entity of theirs arrives.
+        """
+        for priority in priorities:
+            self._get_trackers(priority)
+            if priority not in self._buckets:
+                self._buckets[priority] = deque()
+
     def request(self, entity: Any, current_time: float) -> RequestResult:
         """
         An entity requests a resource. It is served immediately if
@@ -93,7 +131,7 @@ class PriorityQueueModel(BaseQueueModel):
         
         This method *requires* the entity to have a `.priority` attribute.
         """
-        log.debug(f"T={current_time:.2f}: Request from entity {entity}...")
+        log.debug("T=%.2f: Request from entity %s...", current_time, entity)
 
         # Get Priority (New Contract)
         try:
@@ -102,37 +140,52 @@ class PriorityQueueModel(BaseQueueModel):
             log.exception(f"Entity {entity} does not have a '.priority' "
                           f"attribute. Cannot process in PriorityQueueModel.")
             raise
-        
+
+        # Set the new state first: if the entity has no writable
+        # .state, this raises before the model is changed.
+        busy = len(self._user_info)
+        served = busy < self.capacity
+        self._set_entity_state(entity, EntityState.IN_SERVICE if served
+                               else EntityState.WAITING_FOR_RESOURCE)
+
         # Log arrival in *both* trackers
-        self.kpi_tracker.log_arrival(current_time)
-        self.priority_kpi_trackers[priority].log_arrival(current_time)
-
-        if len(self.users) < self.capacity:
-            # Resource Available
-            log.debug(f"T={current_time:.2f}: Resource available for {entity} "
-                      f"(P={priority}).")
-            self._serve_entity(entity, priority,
-                               arrival_time=current_time,
-                               start_time=current_time)
+        trackers = self._get_trackers(priority)
+        for tracker in trackers:
+            tracker.log_arrival(current_time)
+
+        if served:
+            # Resource Available (a free server implies an empty queue)
+            log.debug("T=%.2f: Resource available for %s (P=%s).",
+                      current_time, entity, priority)
+            # Serve (no wait, and both queue lengths are 0)
+            self._user_info[entity] = (priority, current_time, current_time,
+                                       trackers)
+
+            for tracker in trackers:
+                tracker.log_service_start(current_time, 0.0, 0, busy + 1)
             return RequestResult.SERVED_IMMEDIATELY
 
         else:
             # Resource Busy -> Enqueue
-            log.debug(f"T={current_time:.2f}: Resource busy. Queuing {entity} "
-                      f"(P={priority}).")
-
-            # Priority logic: push onto the heap
-            heapq.heappush(self.queue, (priority, current_time, entity))
-            self._set_entity_state(entity, EntityState.WAITING_FOR_RESOURCE)
-
-            # Log queue entry in *both* trackers
-            q_len = len(self.queue)
-            self.kpi_tracker.log_queue_entry(current_time, q_len)
-            self.priority_kpi_trackers[priority].log_queue_entry(
+            log.debug("T=%.2f: Resource busy. Queuing %s (P=%s).",
+                      current_time, entity, priority)
+
+            # Priority logic: append to this priority's bucket
+            bucket = self._buckets.get(priority)
+            if bucket is None:
+                bucket = self._buckets[priority] = deque()
+            if not bucket:
+                insort(self._active_priorities, priority)
+            bucket.append((current_time, entity))
+            self._qlen += 1
+
+            # Log queue entry in *both* trackers: the total queue
+            # length for the main one, this priority's for its own.
+            kpi, ptracker = trackers
+            kpi.log_queue_entry(current_time, self._qlen)
+            ptracker.log_queue_entry(
                 current_time,
-                # NOTE: This is the *total* queue length, not per-priority
-                # A more advanced tracker could log per-priority q_len.
-                current_queue_length=q_len 
+                current_queue_length=len(bucket)
             )
             return RequestResult.QUEUED
 
@@ -141,66 +194,205 @@ class PriorityQueueModel(BaseQueueModel):
         An entity releases a resource. If the queue is not empty,
         the next entity (highest priority) is dequeued and served.
         """
-        log.debug(f"T={current_time:.2f}: Release by entity {entity}...")
+        log.debug("T=%.2f: Release by entity %s...", current_time, entity)
 
-        if entity not in self.users:
+        user_info = self._user_info
+        if entity not in user_info:
             log.error(f"T={current_time:.2f}: Entity {entity} tried to "
                       f"release a resource it does not possess.")
             raise ValueError(f"Entity {entity} not in active users set.")
 
+        # Update State first: if it fails, the model is unchanged
+        self._set_entity_state(entity, EntityState.IDLE)
+
         # Retrieve stored data for the departing entity
-        entity_data = self.user_data.pop(entity)
-        priority = entity_data["priority"]
-        arrival_time = entity_data["arrival_time"]
-        service_start_time = entity_data["service_start_time"]
-        
+        priority, arrival_time, service_start_time, trackers = \
+            user_info.pop(entity)
+
         service_time = current_time - service_start_time
         system_time = current_time - arrival_time
-
-        # Update State
-        self.users.remove(entity)
-        self._set_entity_state(entity, EntityState.IDLE)
-        
-        busy_servers = len(self.users)
+        busy = len(user_info)
 
         # Log service end in *both* trackers
-        self.kpi_tracker.log_service_end(
-            time=current_time, service_time=service_time,
-            system_time=system_time, current_busy_servers=busy_servers
-        )
-        self.priority_kpi_trackers[priority].log_service_end(
-            time=current_time, service_time=service_time,
-            system_time=system_time, current_busy_servers=busy_servers
-        )
-
-        log.debug(f"T={current_time:.2f}: Entity {entity} (P={priority}) "
-                  f"released resource. ServiceTime={service_time:.2f}")
-
-        # --- Check Queue for Next Entity ---
-        if len(self.queue) > 0:
-            # Priority logic: pop from the heap
-            next_priority, next_arrival_time, next_entity = heapq.heappop(
-                self.queue)
+        for tracker in trackers:
+            tracker.log_service_end(current_time, service_time,
+                                    system_time, busy)
 
-            log.debug(f"T={current_time:.2f}: Queue not empty. "
-                      f"Serving next entity {next_entity} (P={next_priority}).")
+        log.debug("T=%.2f: Entity %s (P=%s) released resource. "
+                  "ServiceTime=%.2f", current_time, entity, priority,
+                  service_time)
 
-            self._serve_entity(entity=next_entity, priority=next_priority,
-                               arrival_time=next_arrival_time,
-                               start_time=current_time)
+        # --- Check Queue for Next Entity ---
+        if self._qlen > 0:
+            # Priority logic: pop from the best non-empty bucket
+            next_priority = self._active_priorities[0]
+            bucket = self._buckets[next_priority]
+            next_arrival_time, next_entity = bucket.popleft()
+            if not bucket:
+                del self._active_priorities[0]
+            self._qlen -= 1
+
+            log.debug("T=%.2f: Queue not empty. Serving next entity %s "
+                      "(P=%s).", current_time, next_entity, next_priority)
+
+            # Serve the dequeued entity: set its state to IN_SERVICE
+            # (it accepted a state write when it was queued, so this
+            # is not expected to fail)
+            wait_time = current_time - next_arrival_time
+            next_trackers = self._tracker_pairs[next_priority]
+            user_info[next_entity] = (next_priority, next_arrival_time,
+                                      current_time, next_trackers)
+            self._set_entity_state(next_entity, EntityState.IN_SERVICE)
+
+            kpi, ptracker = next_trackers
+            kpi.log_service_start(
+                time=current_time, wait_time=wait_time,
+                current_queue_length=self._qlen,
+                current_busy_servers=busy + 1
+            )
+            ptracker.log_service_start(
+                time=current_time, wait_time=wait_time,
+                current_queue_length=len(bucket),
+                current_busy_servers=busy + 1
+            )
             return next_entity
 
         else:
-            log.debug(f"T={current_time:.2f}: Resource freed. "
-                      f"Queue is empty.")
+            log.debug("T=%.2f: Resource freed. Queue is empty.", current_time)
             return None
 
+    def release_many(self, entities: Iterable[Any],
+                     current_time: float) -> List[Any]:
+        """
+        Several entities release their resources at the same time.
+        The freed servers are then filled from the queue (highest
+        priority first).
+
+        This is equivalent to calling `release()` for each entity in
+        turn, but the service starts of the dequeued entities are
+        logged in one batch per tracker.
+
+        Returns:
+            List[Any]: The entities that started service, in order.
+
+        Raises:
+            ValueError: If an entity is not in service (or is listed
+                        twice). Nothing is released in that case.
+            AttributeError: If an entity's `.state` cannot be written.
+                            Nothing is released in that case either.
+        """
+        entities = list(entities)
+        user_info = self._user_info
+        kpi = self.kpi_tracker
+        ptrackers = self.priority_kpi_trackers
+
+        seen = set()
+        for entity in entities:
+            if entity not in user_info or entity in seen:
+                log.error(f"T={current_time:.2f}: Entity {entity} tried to "
+                          f"release a resource it does not possess.")
+                raise ValueError(f"Entity {entity} not in active users set.")
+            seen.add(entity)
+
+        # Update all states first, as release() does. If one write
+        # fails, the states already changed are restored and nothing
+        # is released.
+        idle = []
+        try:
+            for entity in entities:
+                self._set_entity_state(entity, EntityState.IDLE)
+                idle.append(entity)
+        except AttributeError:
+            for entity in idle:
+                self._set_entity_state(entity, EntityState.IN_SERVICE)
+            raise
+
+        # Release everyone
+        for entity in entities:
+            _, arrival_time, service_start_time, trackers = \
+                user_info.pop(entity)
+            service_time = current_time - service_start_time
+            system_time = current_time - arrival_time
+            busy = len(user_info)
+
+            for tracker in trackers:
+                tracker.log_service_end(current_time, service_time,
+                                        system_time, busy)
+
+        # Then fill the free servers, collecting the service-start
+        # records as (wait_times, queue_lengths, busy_servers) lists:
+        # one set for the main tracker and one per priority.
+        started = []
+        batch = ([], [], [])
+        priority_batches: Dict[Any, Tuple[List, List, List]] = {}
+        busy = len(user_info)
+        while busy < self.capacity and self._qlen > 0:
+            next_priority = self._active_priorities[0]
+            bucket = self._buckets[next_priority]
+            next_arrival_time, next_entity = bucket.popleft()
+            if not bucket:
+                del self._active_priorities[0]
+            self._qlen -= 1
+            busy += 1
+
+            user_info[next_entity] = (next_priority, next_arrival_time,
+                                      current_time,
+                                      self._tracker_pairs[next_priority])
+            # Not expected to fail: it accepted a write when queued
+            self._set_entity_state(next_entity, EntityState.IN_SERVICE)
+            started.append(next_entity)
+
+            wait_time = current_time - next_arrival_time
+            batch[0].append(wait_time)
+            batch[1].append(self._qlen)
+            batch[2].append(busy)
+            p_batch = priority_batches.get(next_priority)
+            if p_batch is None:
+                p_batch = priority_batches[next_priority] = ([], [], [])
+            p_batch[0].append(wait_time)
+            p_batch[1].append(len(bucket))
+            p_batch[2].append(busy)
+
+        kpi.log_service_starts(current_time, *batch)
+        for priority, p_batch in priority_batches.items():
+            ptrackers[priority].log_service_starts(current_time, *p_batch)
+
+        log.debug("T=%.2f: %d entities released, %d served from the queue.",
+                  current_time, len(entities), len(started))
+        return started
+
+    def reset(self, start_time: float = 0.0):
+        """
+        Empties the model and its KPI trackers so it can be reused,
+        e.g. for the next replication of a simulation.
+
+        Entities still queued or in service are simply forgotten;
+        their `.state` is left untouched. The priority levels are
+        forgotten too (call `register_priorities()` again if needed).
+
+        Args:
+            start_time (float, optional): The simulation time at which
+                                          the model restarts. Defaults to 0.0.
+        """
+        self.start_time = start_time
+        self._buckets.clear()
+        self._active_priorities.clear()
+        self._qlen = 0
+        self._user_info.clear()
+        self.priority_kpi_trackers.clear()
+        self._tracker_pairs.clear()
+        self.kpi_tracker.reset(start_time)
+
     def get_final_kpis(self, simulation_end_time: float) -> Dict[str, Any]:
         """
         Gets the final KPI report, including the priority breakdown.
 
         This overrides the base method to *add* the priority-specific
         KPIs to the final report.
+
+        Each call returns a new dictionary; the reports behind it are
+        memoized by each tracker (see Measure.get_kpi_report), so
+        repeated calls only rebuild the dictionaries.
         """
         log.info(f"Calculating final KPIs at T={simulation_end_time:.2f}")
 
@@ -210,7 +402,7 @@ class PriorityQueueModel(BaseQueueModel):
         # Build the priority breakdown
         priority_breakdown = {}
         for priority, tracker in self.priority_kpi_trackers.items():
-            log.debug(f"Calculating KPIs for priority level {priority}...")
+            log.debug("Calculating KPIs for priority level %s...", priority)
             priority_kpis = tracker.get_final_kpis(simulation_end_time)
             priority_breakdown[priority] = priority_kpis
         
@@ -221,40 +413,30 @@ class PriorityQueueModel(BaseQueueModel):
 
     
 
-    def _serve_entity(self, entity: Any, priority: float, arrival_time: float,
-                      start_time: float):
-        """Internal helper to move an entity into the IN_SERVICE state."""
-        wait_time = start_time - arrival_time
-
-        # Update State
-        self.users.add(entity)
-        # Store all data needed upon release
-        self.user_data[entity] = {
-            "priority": priority,
-            "arrival_time": arrival_time,
-            "service_start_time": start_time
-        }
-        self._set_entity_state(entity, EntityState.IN_SERVICE)
-        
-        busy_servers = len(self.users)
-        q_len = len(self.queue)
-
-        # Log KPIs in *both* trackers
-        self.kpi_tracker.log_service_start(
-            time=start_time, wait_time=wait_time,
-            current_queue_length=q_len,
-            current_busy_servers=busy_servers
-        )
-        self.priority_kpi_trackers[priority].log_service_start(
-            time=start_time, wait_time=wait_time,
-            current_queue_length=q_len,
-            current_busy_servers=busy_servers
-        )
+    def _get_trackers(self, priority: Any) -> Tuple[Measure, Measure]:
+        """Returns the (main, priority) tracker pair of a priority level."""
+        pair = self._tracker_pairs.get(priority)
+        if pair is None:
+            pair = (self.kpi_tracker, self._get_ptracker(priority))
+            self._tracker_pairs[priority] = pair
+        return pair
+
+    def _get_ptracker(self, priority: Any) -> Measure:
+        """Returns the tracker of a priority level, creating it if new."""
+        tracker = self.priority_kpi_trackers.get(priority)
+        if tracker is None:
+            tracker = Measure(capacity=self.capacity,
+                              start_time=self.start_time)
+            self.priority_kpi_trackers[priority] = tracker
+        return tracker
 
     def _set_entity_state(self, entity: Any, state: EntityState):
-        """Safely sets the entity's state attribute."""
-        try:
-            entity.state = state
-        except AttributeError:
-            log.warning(f"Entity {entity} does not have a '.state' "
-                        f"attribute or it is not mutable.")
\ No newline at end of file
+        """
+        Sets the entity's state attribute.
+
+        Entities must expose a writable `.state` (see
+        BaseQueueModel.request); otherwise the AttributeError
+        propagates to the caller. The model sets the state *before*
+        changing its own, so such a failure leaves it untouched.
+        """
+        entity.state = state
\ No newline at end of file
@@ -0,0 +1,104 @@
+# src/queue_framework/report.py
+
+"""
+Defines the typed containers of a final KPI report.
+
+`Measure.get_kpi_report()` returns a `KPIReport`, built from a few
+small slotted dataclasses (one per report section) instead of nested
+dictionaries. Every container offers `to_dict()`, which produces the
+nested-dictionary layout returned by `Measure.get_final_kpis()`.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, Tuple
+
+
+class _ReportSection:
+    """Mixin providing the dictionary form of a slotted section."""
+
+    __slots__ = ()
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Returns the section as a {field_name: value} dictionary."""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+@dataclass
+class SimulationSummary(_ReportSection):
+    """Time span and capacity the report refers to."""
+
+    __slots__ = ("start_time", "end_time", "total_duration",
+                 "total_capacity")
+
+    start_time: float
+    end_time: float
+    total_duration: float
+    total_capacity: int
+
+
+@dataclass
+class ArrivalsAndThroughput(_ReportSection):
+    """Entity counters and the probability of having to wait."""
+
+    __slots__ = ("total_arrivals", "total_served", "total_who_waited",
+                 "probability_of_waiting")
+
+    total_arrivals: int
+    total_served: int
+    total_who_waited: int
+    probability_of_waiting: float
+
+
+@dataclass
+class StatsBlock(_ReportSection):
+    """Statistical summary of a list of observations."""
+
+    __slots__ = ("mean", "std_dev", "count", "confidence_interval_95")
+
+    mean: float
+    std_dev: float
+    count: int
+    confidence_interval_95: Tuple[float, float]
+
+
+@dataclass
+class QueueLengthStats(_ReportSection):
+    """Time-weighted and peak queue length."""
+
+    __slots__ = ("time_weighted_average", "max_observed")
+
+    time_weighted_average: float
+    max_observed: int
+
+
+@dataclass
+class ServerUtilizationStats(_ReportSection):
+    """Time-weighted busy servers and the matching utilization."""
+
+    __slots__ = ("time_weighted_average_busy_servers",
+                 "average_utilization_percentage")
+
+    time_weighted_average_busy_servers: float
+    average_utilization_percentage: float
+
+
+@dataclass
+class KPIReport(_ReportSection):
+    """The full final KPI report of a `Measure`."""
+
+    __slots__ = ("simulation_summary", "arrivals_and_throughput",
+                 "wait_time", "service_time", "system_time",
+                 "queue_length", "server_utilization")
+
+    simulation_summary: SimulationSummary
+    arrivals_and_throughput: ArrivalsAndThroughput
+    wait_time: StatsBlock
+    service_time: StatsBlock
+    system_time: StatsBlock
+    queue_length: QueueLengthStats
+    server_utilization: ServerUtilizationStats
+
+    def to_dict(self) -> Dict[str, Dict[str, Any]]:
+        """Returns the report as a nested {section: {field: value}} dict."""
+        return {name: getattr(self, name).to_dict()
+                for name in self.__slots__}
@@ -0,0 +1,63 @@
+# tests/conftest.py
+
+"""
+Fixtures shared by the test modules of the queue models.
+"""
+
+import pytest
+
+from queue_framework import EntityState
+
+
+class MockEntity:
+    """
+    A mock entity that satisfies the contract of every model:
+    a mutable .state attribute, and the .priority attribute
+    required by PriorityQueueModel (ignored by the others).
+    """
+    __slots__ = ("state", "name", "priority")
+
+    def __init__(self, name="", priority=1):
+        self.state = EntityState.IDLE
+        self.name = name  # For easier debugging in test outputs
+        self.priority = priority
+
+
+@pytest.fixture(scope="session")
+def make_entity():
+    """
+    Returns the factory of mock entities:
+    make_entity(name="", priority=1) -> MockEntity.
+    """
+    return MockEntity
+
+
+class LockableEntity(MockEntity):
+    """
+    A mock entity whose .state becomes read-only once `locked` is
+    set, to check how the models handle a failing state update.
+    """
+    __slots__ = ("_state", "locked")
+
+    def __init__(self, name="", priority=1):
+        self.locked = False
+        super().__init__(name, priority)
+
+    @property
+    def state(self):
+        return self._state
+
+    @state.setter
+    def state(self, value):
+        if self.locked:
+            raise AttributeError(f"{self.name}.state is read-only")
+        self._state = value
+
+
+@pytest.fixture(scope="session")
+def make_lockable_entity():
+    """
+    Returns the factory of lockable mock entities:
+    make_lockable_entity(name="", priority=1) -> LockableEntity.
+    """
+    return LockableEntity
@@ -0,0 +1,50 @@
+# tests/test_benchmarks.py
+
+"""
+Micro-benchmarks of the per-event hot path of the queue models.
+
+They guard the latency of `request()`/`release()` against
+regressions and need the `pytest-benchmark` plugin (part of the
+`[dev]` extra); the module is skipped when it is not installed.
+Run only these with `pytest -m benchmark`, or skip them with
+`pytest --benchmark-skip`.
+"""
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from queue_framework import PriorityQueueModel
+
+N_ENTITIES = 1000
+
+
+@pytest.mark.benchmark(group="priority_model")
+def test_request_release_benchmark(benchmark, make_entity):
+    """
+    Benchmarks 1000 requests on a busy single server (one served,
+    the rest queued over 9 priority levels) followed by the 1000
+    releases that drain the queue.
+    """
+    def setup():
+        model = PriorityQueueModel(capacity=1, start_time=0.0)
+        entities = [make_entity(f"e{i}", priority=i % 9 + 1)
+                    for i in range(N_ENTITIES)]
+        return (model, entities), {}
+
+    def run(model, entities):
+        for i, entity in enumerate(entities):
+            model.request(entity, float(i))
+
+        in_service = entities[0]
+        time = float(N_ENTITIES)
+        while in_service is not None:
+            in_service = model.release(in_service, time)
+            time += 1.0
+        return model
+
+    model = benchmark.pedantic(run, setup=setup, rounds=50,
+                               warmup_rounds=3)
+
+    assert len(model.users) == 0
+    assert model.kpi_tracker.total_served == N_ENTITIES
@@ -0,0 +1,23 @@
+# tests/test_constants.py
+
+"""
+Unit tests for the enumerations in src/queue_framework/constants.py.
+
+The enums are IntEnums (so they compare as plain integers), but their
+text representation must stay readable in logs and printed results.
+"""
+
+from queue_framework import EntityState, RequestResult
+
+
+def test_enum_members_are_ints():
+    """Test that enum members behave as plain integers."""
+    assert isinstance(RequestResult.QUEUED, int)
+    assert isinstance(EntityState.IDLE, int)
+    assert RequestResult.QUEUED == RequestResult.QUEUED.value
+
+
+def test_enum_text_representation_is_unchanged():
+    """Test that str() and f-strings still produce 'Class.MEMBER'."""
+    assert str(RequestResult.QUEUED) == "RequestResult.QUEUED"
+    assert f"{EntityState.IN_SERVICE}" == "EntityState.IN_SERVICE"
@@ -20,20 +20,6 @@ from queue_framework import (
     RequestResult
 )
 
-class MockEntity:
-    """
-    A minimal mock entity that satisfies the "contract"
-    required by the QueueModel (a mutable .state attribute).
-    """
-    def __init__(self, name=""):
-        self.state = EntityState.IDLE
-        self.name = name  # For easier debugging in test outputs
-        # Note: No .priority attribute is needed for the FIFO model
-    
-    def __repr__(self):
-        return f"MockEntity(name='{self.name}')"
-
-
 
 @pytest.fixture
 def model_cap1() -> FIFOQueueModel:
@@ -52,8 +38,6 @@ def model_cap2() -> FIFOQueueModel:
     return FIFOQueueModel(capacity=2, start_time=0.0)
 
 
-
-
 def test_initialization():
     """Test that the model initializes with correct default values."""
     model = FIFOQueueModel(capacity=5)
@@ -65,14 +49,14 @@ def test_initialization():
     assert isinstance(model.kpi_tracker, object) # Check that it has a tracker
 
 
-def test_request_server_free(model_cap1: FIFOQueueModel):
+def test_request_server_free(model_cap1: FIFOQueueModel, make_entity):
     """
     Test the 'request' method when a server is available.
     - Entity should be served immediately.
     - Entity state should change to IN_SERVICE.
     - Model 'users' should contain the entity.
     """
-    entity = MockEntity()
+    entity = make_entity()
     
     # Action
     result = model_cap1.request(entity, current_time=10.0)
@@ -85,15 +69,15 @@ def test_request_server_free(model_cap1: FIFOQueueModel):
     assert len(model_cap1.queue) == 0
 
 
-def test_request_server_busy(model_cap1: FIFOQueueModel):
+def test_request_server_busy(model_cap1: FIFOQueueModel, make_entity):
     """
     Test the 'request' method when the server is busy.
     - Entity should be queued.
     - Entity state should change to WAITING_FOR_RESOURCE.
     - Model 'queue' should contain the entity.
     """
-    entity1 = MockEntity("e1")
-    entity2 = MockEntity("e2")
+    entity1 = make_entity("e1")
+    entity2 = make_entity("e2")
     
     # Action (Fill the server)
     model_cap1.request(entity1, current_time=10.0)
@@ -110,14 +94,14 @@ def test_request_server_busy(model_cap1: FIFOQueueModel):
     assert model_cap1.queue[0][0] == entity2 # Check queue content
 
 
-def test_release_queue_empty(model_cap1: FIFOQueueModel):
+def test_release_queue_empty(model_cap1: FIFOQueueModel, make_entity):
     """
     Test the 'release' method when the queue is empty.
     - The released entity's state should be IDLE.
     - The server pool ('users') should become empty.
     - The method should return None (no one was served from queue).
     """
-    entity = MockEntity()
+    entity = make_entity()
     model_cap1.request(entity, current_time=10.0)
     
     # Pre-check
@@ -133,7 +117,7 @@ def test_release_queue_empty(model_cap1: FIFOQueueModel):
     assert len(model_cap1.queue) == 0
 
 
-def test_fifo_logic(model_cap1: FIFOQueueModel):
+def test_fifo_logic(model_cap1: FIFOQueueModel, make_entity):
     """
     Test the core FIFO (First-In, First-Out) logic.
     - e1 fills the server.
@@ -141,9 +125,9 @@ def test_fifo_logic(model_cap1: FIFOQueueModel):
     - e3 enters the queue second.
     - When e1 releases, e2 should be served (not e3).
     """
-    e1 = MockEntity("e1_server")
-    e2 = MockEntity("e2_first_in_queue")
-    e3 = MockEntity("e3_second_in_queue")
+    e1 = make_entity("e1_server")
+    e2 = make_entity("e2_first_in_queue")
+    e3 = make_entity("e3_second_in_queue")
     
     # Action (Load the system)
     model_cap1.request(e1, current_time=10.0)
@@ -171,16 +155,16 @@ def test_fifo_logic(model_cap1: FIFOQueueModel):
     assert model_cap1.queue[0][0] == e3 # e3 is now at the front
 
 
-def test_multi_capacity_logic(model_cap2: FIFOQueueModel):
+def test_multi_capacity_logic(model_cap2: FIFOQueueModel, make_entity):
     """
     Test that a model with capacity > 1 works correctly.
     - e1 and e2 should be served immediately.
     - e3 should be queued.
     - Releasing e1 should serve e3.
     """
-    e1 = MockEntity("e1")
-    e2 = MockEntity("e2")
-    e3 = MockEntity("e3")
+    e1 = make_entity("e1")
+    e2 = make_entity("e2")
+    e3 = make_entity("e3")
     
     # Action (Fill servers)
     res1 = model_cap2.request(e1, current_time=10.0)
@@ -206,13 +190,78 @@ def test_multi_capacity_logic(model_cap2: FIFOQueueModel):
     assert len(model_cap2.queue) == 0
 
 
-def test_release_invalid_entity(model_cap1: FIFOQueueModel):
+def test_release_invalid_entity(model_cap1: FIFOQueueModel, make_entity):
     """Test that releasing an entity not in service raises a ValueError."""
-    e1 = MockEntity("e1")
-    e2 = MockEntity("e2_not_in_service")
+    e1 = make_entity("e1")
+    e2 = make_entity("e2_not_in_service")
     
     model_cap1.request(e1, 10.0) # e1 is in service
     
     # Attempt to release e2, which was never in service
     with pytest.raises(ValueError):
-        model_cap1.release(e2, 15.0)
\ No newline at end of file
+        model_cap1.release(e2, 15.0)
+
+def test_reset(model_cap1: FIFOQueueModel, make_entity):
+    """
+    Test that reset() empties the model and its tracker, and that
+    the reset model behaves like a fresh one.
+    """
+    e1 = make_entity("e1")
+    e2 = make_entity("e2")
+    model_cap1.request(e1, current_time=10.0)
+    model_cap1.request(e2, current_time=11.0) # e2 waits
+
+    model_cap1.reset(start_time=100.0)
+
+    assert len(model_cap1.users) == 0
+    assert len(model_cap1.queue) == 0
+    assert model_cap1.kpi_tracker.total_arrivals == 0
+    assert model_cap1.kpi_tracker.queue_length_log == [(100.0, 0)]
+
+    # Replay: e2 is served immediately now
+    assert model_cap1.request(e2, current_time=101.0) == \
+        RequestResult.SERVED_IMMEDIATELY
+    model_cap1.release(e2, current_time=105.0)
+
+    kpis = model_cap1.get_final_kpis(simulation_end_time=110.0)
+    assert kpis["simulation_summary"]["total_duration"] == 10.0
+    assert kpis["arrivals_and_throughput"]["total_served"] == 1
+
+
+def test_state_update_failure_leaves_model_unchanged(
+        model_cap1: FIFOQueueModel, make_entity, make_lockable_entity):
+    """
+    Test that an entity whose .state cannot be written makes
+    request()/release() raise AttributeError *before* the model
+    changes: nothing is served, queued, released or logged.
+    """
+    # Serve path
+    stuck = make_lockable_entity("stuck")
+    stuck.locked = True
+    with pytest.raises(AttributeError):
+        model_cap1.request(stuck, current_time=0.0)
+    assert len(model_cap1.users) == 0
+    assert model_cap1.kpi_tracker.total_arrivals == 0
+
+    # Queue path
+    e1 = make_lockable_entity("e1")
+    model_cap1.request(e1, current_time=1.0)
+    with pytest.raises(AttributeError):
+        model_cap1.request(stuck, current_time=2.0)
+    assert len(model_cap1.queue) == 0
+    assert model_cap1.kpi_tracker.total_arrivals == 1
+
+    # Release path: e1 keeps its server and e2 keeps waiting
+    e2 = make_entity("e2")
+    model_cap1.request(e2, current_time=3.0)
+    e1.locked = True
+    with pytest.raises(AttributeError):
+        model_cap1.release(e1, current_time=4.0)
+    assert list(model_cap1.users) == [e1]
+    assert model_cap1.queue == [(e2, 3.0)]
+    assert model_cap1.kpi_tracker.total_served == 0
+
+    # Once writable again, the release goes through as usual
+    e1.locked = False
+    assert model_cap1.release(e1, current_time=5.0) is e2
+    assert e2.state == EntityState.IN_SERVICE
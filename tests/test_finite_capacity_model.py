@@ -21,18 +21,6 @@ from queue_framework import (
 )
 
 
-
-class MockEntity:
-    """A minimal mock entity with a .state attribute."""
-    def __init__(self, name=""):
-        self.state = EntityState.IDLE
-        self.name = name
-    
-    def __repr__(self):
-        return f"MockEntity(name='{self.name}')"
-
-
-
 @pytest.fixture
 def model_1_1() -> FiniteCapacityModel:
     """
@@ -54,8 +42,6 @@ def model_2_2() -> FiniteCapacityModel:
     return FiniteCapacityModel(capacity=2, queue_capacity=2, start_time=0.0)
 
 
-
-
 def test_initialization():
     """Test that the model initializes with both capacity args."""
     model = FiniteCapacityModel(capacity=5, queue_capacity=10)
@@ -65,11 +51,11 @@ def test_initialization():
     assert len(model.queue) == 0
     assert len(model.users) == 0
 
-def test_initialization_zero_queue():
+def test_initialization_zero_queue(make_entity):
     """Test that a model with a zero-size queue is valid (G/G/c/c)."""
     model = FiniteCapacityModel(capacity=1, queue_capacity=0)
-    e1 = MockEntity("e1")
-    e2 = MockEntity("e2")
+    e1 = make_entity("e1")
+    e2 = make_entity("e2")
     
     # First entity should be served
     res1 = model.request(e1, 0.0)
@@ -80,9 +66,9 @@ def test_initialization_zero_queue():
     assert res2 == RequestResult.REJECTED_QUEUE_FULL
 
 
-def test_request_server_free(model_1_1: FiniteCapacityModel):
+def test_request_server_free(model_1_1: FiniteCapacityModel, make_entity):
     """Test the 'request' method when a server is free."""
-    entity = MockEntity()
+    entity = make_entity()
     result = model_1_1.request(entity, current_time=10.0)
     
     assert result == RequestResult.SERVED_IMMEDIATELY
@@ -91,13 +77,14 @@ def test_request_server_free(model_1_1: FiniteCapacityModel):
     assert len(model_1_1.queue) == 0
 
 
-def test_request_server_busy_queue_available(model_1_1: FiniteCapacityModel):
+def test_request_server_busy_queue_available(model_1_1: FiniteCapacityModel,
+                                             make_entity):
     """
     Test 'request' when the server is busy but the queue has space.
     - Entity should be QUEUED.
     """
-    e1 = MockEntity("e1_server")
-    e2 = MockEntity("e2_queue")
+    e1 = make_entity("e1_server")
+    e2 = make_entity("e2_queue")
     
     # Action (Fill the server)
     model_1_1.request(e1, current_time=10.0)
@@ -113,9 +100,9 @@ def test_request_server_busy_queue_available(model_1_1: FiniteCapacityModel):
     assert model_1_1.queue[0][0] == e2 # Check queue content
 
 
-def test_release_queue_empty(model_1_1: FiniteCapacityModel):
+def test_release_queue_empty(model_1_1: FiniteCapacityModel, make_entity):
     """Test 'release' when the queue is empty."""
-    entity = MockEntity()
+    entity = make_entity()
     model_1_1.request(entity, current_time=10.0)
     
     # Action
@@ -128,7 +115,8 @@ def test_release_queue_empty(model_1_1: FiniteCapacityModel):
     assert len(model_1_1.queue) == 0
 
 
-def test_request_reject_on_full_queue(model_1_1: FiniteCapacityModel):
+def test_request_reject_on_full_queue(model_1_1: FiniteCapacityModel,
+                                      make_entity):
     """
     Test the core "balking" (rejection) logic.
     - Model has cap=1, q_cap=1.
@@ -136,9 +124,9 @@ def test_request_reject_on_full_queue(model_1_1: FiniteCapacityModel):
     - e2 should take the queue slot.
     - e3 should be REJECTED.
     """
-    e1 = MockEntity("e1_server")
-    e2 = MockEntity("e2_queue")
-    e3 = MockEntity("e3_rejected")
+    e1 = make_entity("e1_server")
+    e2 = make_entity("e2_queue")
+    e3 = make_entity("e3_rejected")
     
     # Action (Fill the system)
     model_1_1.request(e1, current_time=10.0) # Fills server
@@ -163,7 +151,7 @@ def test_request_reject_on_full_queue(model_1_1: FiniteCapacityModel):
     assert model_1_1.queue[0][0] == e2 # e3 was not added
 
 
-def test_fifo_logic_is_preserved(model_2_2: FiniteCapacityModel):
+def test_fifo_logic_is_preserved(model_2_2: FiniteCapacityModel, make_entity):
     """
     Test that the *internal queue* still obeys FIFO logic.
     - We use a (cap=2, q_cap=2) model.
@@ -171,10 +159,10 @@ def test_fifo_logic_is_preserved(model_2_2: FiniteCapacityModel):
     - e3, e4 fill queue (e3 enters first).
     - When e1 releases, e3 should be served (not e4).
     """
-    e1 = MockEntity("e1_server")
-    e2 = MockEntity("e2_server")
-    e3 = MockEntity("e3_first_in_queue")
-    e4 = MockEntity("e4_second_in_queue")
+    e1 = make_entity("e1_server")
+    e2 = make_entity("e2_server")
+    e3 = make_entity("e3_first_in_queue")
+    e4 = make_entity("e4_second_in_queue")
     
     # Action (Phase 1: Load the system)
     model_2_2.request(e1, current_time=10.0)
@@ -197,4 +185,43 @@ def test_fifo_logic_is_preserved(model_2_2: FiniteCapacityModel):
     assert e4.state == EntityState.WAITING_FOR_RESOURCE
     assert len(model_2_2.users) == 2 # e2 and e3
     assert len(model_2_2.queue) == 1
-    assert model_2_2.queue[0][0] == e4 # e4 is now at the front
\ No newline at end of file
+    assert model_2_2.queue[0][0] == e4 # e4 is now at the front
+
+def test_reset_clears_rejections(model_1_1: FiniteCapacityModel, make_entity):
+    """Test that reset() frees the system and zeroes the rejections."""
+    for i in range(3):
+        model_1_1.request(make_entity(f"e{i}"), current_time=10.0 + i)
+    assert model_1_1.total_rejections == 1
+
+    model_1_1.reset(start_time=20.0)
+
+    assert model_1_1.total_rejections == 0
+    assert len(model_1_1.users) == 0
+    assert len(model_1_1.queue) == 0
+    assert model_1_1.request(make_entity("e3"), current_time=21.0) == \
+        RequestResult.SERVED_IMMEDIATELY
+
+
+def test_state_update_failure_leaves_model_unchanged(
+        model_1_1: FiniteCapacityModel, make_entity, make_lockable_entity):
+    """
+    Test that an admitted entity whose .state cannot be written makes
+    request() raise before the model changes, while a rejected one
+    (whose state is never touched) is simply rejected.
+    """
+    stuck = make_lockable_entity("stuck")
+    stuck.locked = True
+    with pytest.raises(AttributeError):
+        model_1_1.request(stuck, current_time=0.0)
+    assert len(model_1_1.users) == 0
+    assert model_1_1.kpi_tracker.total_arrivals == 0
+
+    model_1_1.request(make_entity("e1"), current_time=1.0) # Served
+    with pytest.raises(AttributeError):
+        model_1_1.request(stuck, current_time=2.0)
+    assert len(model_1_1.queue) == 0
+
+    model_1_1.request(make_entity("e2"), current_time=3.0) # Queued
+    assert model_1_1.request(stuck, current_time=4.0) == \
+        RequestResult.REJECTED_QUEUE_FULL
+    assert model_1_1.total_rejections == 1
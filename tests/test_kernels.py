@@ -0,0 +1,43 @@
+# tests/test_kernels.py
+
+"""
+Unit tests for the numeric kernels (src/queue_framework/_kernels.py).
+
+The kernels are exercised as they are installed: JIT-compiled when
+Numba is available, plain Python functions otherwise.
+"""
+
+import pytest
+from pytest import approx
+
+from queue_framework import _kernels
+
+np = pytest.importorskip("numpy")
+
+
+def test_welford_matches_two_pass_statistics():
+    """Test the one-pass mean/variance against NumPy."""
+    data = np.array([10.0, 12.0, 15.0, 11.0, 13.0])
+
+    mean, variance = _kernels.welford(data)
+
+    assert mean == approx(12.2)
+    assert variance == approx(data.var(ddof=1))
+
+
+def test_welford_single_and_empty_samples():
+    """Test that fewer than two samples yield zero variance."""
+    assert _kernels.welford(np.array([4.0])) == (4.0, 0.0)
+    assert _kernels.welford(np.array([], dtype=np.float64)) == (0.0, 0.0)
+
+
+def test_time_weighted_average_kernel():
+    """
+    Test the kernel on the series used in test_measure:
+    0 until T=5, 1 until T=10, then 0 until T=20 -> 5 / 20.
+    """
+    times = np.array([0.0, 5.0, 10.0])
+    values = np.array([0.0, 1.0, 0.0])
+
+    assert _kernels.time_weighted_average(times, values, 0.0, 20.0) \
+        == approx(0.25)
@@ -12,6 +12,7 @@ import pytest
 from pytest import approx  # Import approx for floating point comparison
 
 # Import the class we are testing
+from queue_framework import measure as measure_module
 from queue_framework.measure import Measure
 
 
@@ -78,7 +79,8 @@ def test_measure_initialization():
     assert m.start_time == 10.0
     assert m.last_update_time == 10.0
     assert m.total_arrivals == 0
-    assert m.wait_times == []
+    assert len(m.wait_times) == 0
+    assert m.wait_times.typecode == "d"  # Packed array of doubles
     
     # Check that initial state is logged
     assert m.queue_length_log == [(10.0, 0)]
@@ -133,10 +135,37 @@ def test_internal_statistical_summary(empty_measure: Measure):
     assert ci_high == approx(13.88605, abs=1e-5)
 
 
-def test_internal_time_weighted_average(empty_measure: Measure):
+def test_internal_statistical_summary_without_numpy(
+    empty_measure: Measure, monkeypatch: pytest.MonkeyPatch
+):
+    """
+    Test that the pure-Python fallback (used when NumPy is not
+    installed) gives the same summary as the test above.
+    """
+    monkeypatch.setattr(measure_module, "np", None)
+
+    stats = empty_measure._calculate_statistical_summary(
+        [10.0, 12.0, 15.0, 11.0, 13.0])
+
+    assert stats["count"] == 5
+    assert stats["mean"] == approx(12.2)
+    assert stats["std_dev"] == approx(1.923538, abs=1e-5)
+    assert stats["confidence_interval_95"] == (
+        approx(10.51394, abs=1e-5), approx(13.88605, abs=1e-5))
+
+    # A single sample has no spread
+    single = empty_measure._calculate_statistical_summary([4.0])
+    assert single["std_dev"] == 0.0
+
+
+@pytest.mark.parametrize("use_numpy", [True, False],
+                         ids=["numpy", "pure_python"])
+def test_internal_time_weighted_average(
+    empty_measure: Measure, monkeypatch: pytest.MonkeyPatch, use_numpy: bool
+):
     """
     Test the _calculate_time_weighted_average helper function
-    with a known log.
+    with a known log, on both the NumPy and the pure-Python path.
     
     Log:
     - T=0 to T=10: value = 5 (Duration 10) -> Integral = 50
@@ -147,14 +176,17 @@ def test_internal_time_weighted_average(empty_measure: Measure):
     Total Duration = 20
     Time-Weighted Average = 100 / 20 = 5.0
     """
-    log_data = [
-        (0.0, 5),   # Starts at 5
-        (10.0, 2),  # Drops to 2 at T=10
-        (15.0, 8)   # Rises to 8 at T=15
-    ]
+    if not use_numpy:
+        monkeypatch.setattr(measure_module, "np", None)
+    elif measure_module.np is None:
+        pytest.skip("NumPy is not installed")
+
+    times = [0.0, 10.0, 15.0]  # Starts at 5, drops at T=10, rises at T=15
+    values = [5, 2, 8]
     total_duration = 20.0
     
-    avg = empty_measure._calculate_time_weighted_average(log_data, total_duration)
+    avg = empty_measure._calculate_time_weighted_average(
+        times, values, total_duration)
     
     assert avg == approx(5.0)
 
@@ -183,9 +215,150 @@ def test_get_final_kpis_with_data(simple_measure: Measure):
     
     # Queue Length (Integral=5, Duration=20 -> Avg=0.25)
     assert kpis["queue_length"]["time_weighted_average"] == approx(0.25)
+    assert kpis["queue_length"]["max_observed"] == 1
     
     # Server Utilization (Integral=10, Duration=20 -> AvgBusy=0.5)
     util_stats = kpis["server_utilization"]
     assert util_stats["time_weighted_average_busy_servers"] == approx(0.5)
     # (Capacity=1, AvgBusy=0.5 -> Utilization=50%)
-    assert util_stats["average_utilization_percentage"] == approx(0.5)
\ No newline at end of file
+    assert util_stats["average_utilization_percentage"] == approx(0.5)
+
+def test_time_weighted_logs_are_parallel_series(empty_measure: Measure):
+    """
+    Test that the time-weighted logs are kept as parallel
+    (timestamps, values) packed arrays, and that the tuple-based
+    views stay consistent with them.
+    """
+    empty_measure.log_queue_entry(time=2.0, current_queue_length=1)
+    empty_measure.log_service_start(time=4.0, wait_time=2.0,
+                                    current_queue_length=0,
+                                    current_busy_servers=1)
+
+    assert list(empty_measure.queue_length_times) == [0.0, 2.0, 4.0]
+    assert list(empty_measure.queue_length_values) == [0, 1, 0]
+    assert list(empty_measure.server_busy_times) == [0.0, 4.0]
+    assert list(empty_measure.server_busy_values) == [0, 1]
+
+    # Tuple view
+    assert empty_measure.queue_length_log == [(0.0, 0), (2.0, 1), (4.0, 0)]
+    assert empty_measure.server_busy_log == [(0.0, 0), (4.0, 1)]
+
+    # The running maximum follows queue entries
+    assert empty_measure.max_queue_length == 1
+
+    # Assigning a tuple log splits it into the two series
+    empty_measure.server_busy_log = [(0.0, 0), (1.0, 1)]
+    assert list(empty_measure.server_busy_times) == [0.0, 1.0]
+    assert list(empty_measure.server_busy_values) == [0, 1]
+
+
+def test_mean_properties(simple_measure: Measure):
+    """
+    Test the mean properties, including that they follow new
+    observations and replaced lists (even of the same length).
+    """
+    # Wait times: [5, 10, 15] -> mean=10; System times: [13, 20, 27] -> 20
+    assert simple_measure.mean_wait_time == approx(10.0)
+    assert simple_measure.mean_system_time == approx(20.0)
+
+    simple_measure.wait_times.append(30.0)  # [5, 10, 15, 30] -> 15
+    assert simple_measure.mean_wait_time == approx(15.0)
+
+    simple_measure.wait_times[0] = 9.0  # [9, 10, 15, 30] -> 16
+    assert simple_measure.mean_wait_time == approx(16.0)
+
+    for i in range(1, 50):
+        simple_measure.system_times = [float(i), float(i)]
+        assert simple_measure.mean_system_time == float(i)
+
+    assert Measure(capacity=1).mean_wait_time == 0.0
+
+
+def test_get_final_kpis_is_memoized(simple_measure: Measure):
+    """
+    Test that repeated reports are equal but distinct dictionaries,
+    that callers cannot corrupt later ones, and that a new event
+    changes the result.
+    """
+    kpis = simple_measure.get_final_kpis(simulation_end_time=20.0)
+    again = simple_measure.get_final_kpis(simulation_end_time=20.0)
+    assert again == kpis
+    assert again is not kpis
+    assert again["wait_time"] is not kpis["wait_time"]
+
+    kpis["arrivals_and_throughput"]["total_rejections"] = 99
+    later = simple_measure.get_final_kpis(simulation_end_time=20.0)
+    assert later == again
+    assert "total_rejections" not in later["arrivals_and_throughput"]
+
+    simple_measure.log_arrival(20.0)
+    refreshed = simple_measure.get_final_kpis(simulation_end_time=20.0)
+    assert refreshed["arrivals_and_throughput"]["total_arrivals"] == 1
+
+
+def test_kpi_report_follows_reassigned_series(simple_measure: Measure):
+    """
+    Test that reassigning a series, even with an equal-length one
+    that may reuse a freed address, refreshes the memoized report.
+    """
+    for i in range(1, 50):
+        simple_measure.wait_times = [float(i)] * 3
+        simple_measure.queue_length_log = [(0.0, 0), (10.0, i)]
+        report = simple_measure.get_kpi_report(simulation_end_time=20.0)
+        assert report.wait_time.mean == float(i)
+        assert report.queue_length.time_weighted_average == approx(i / 2)
+
+
+def test_out_of_order_event_is_rejected(simple_measure: Measure):
+    """
+    Test that, in debug runs, an event older than the last one fails
+    before the tracker changes (time must be non-decreasing).
+    """
+    if not __debug__:
+        pytest.skip("time-order checks are disabled under python -O")
+
+    with pytest.raises(AssertionError):
+        simple_measure.log_arrival(time=5.0)
+    assert simple_measure.last_update_time == 20.0
+    assert simple_measure.total_arrivals == 0
+
+    simple_measure.log_arrival(time=20.0)  # Same time is fine
+    assert simple_measure.total_arrivals == 1
+
+
+def test_get_kpi_report(simple_measure: Measure):
+    """
+    Test the typed report: attribute access, dictionary form,
+    and the zero-duration case.
+    """
+    report = simple_measure.get_kpi_report(simulation_end_time=20.0)
+
+    assert report.wait_time.mean == approx(10.0)
+    assert report.queue_length.time_weighted_average == approx(0.25)
+    assert report.to_dict() == \
+        simple_measure.get_final_kpis(simulation_end_time=20.0)
+
+    assert Measure(capacity=1).get_kpi_report(0.0) is None
+
+
+def test_reset_reuses_buffers(simple_measure: Measure):
+    """
+    Test that reset() clears all data in place and leaves no
+    stale results behind.
+    """
+    simple_measure.log_queue_entry(time=21.0, current_queue_length=3)
+    assert simple_measure.mean_wait_time == approx(10.0)
+    wait_times = simple_measure.wait_times
+
+    simple_measure.reset(start_time=5.0)
+
+    assert simple_measure.wait_times is wait_times
+    assert len(wait_times) == 0
+    assert simple_measure.queue_length_log == [(5.0, 0)]
+    assert simple_measure.server_busy_log == [(5.0, 0)]
+    assert simple_measure.max_queue_length == 0
+    assert simple_measure.total_waited == 0
+
+    # Same buffer, new data of the same length: no stale mean
+    wait_times.extend([1.0, 2.0, 3.0])
+    assert simple_measure.mean_wait_time == approx(2.0)
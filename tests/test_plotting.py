@@ -0,0 +1,70 @@
+# tests/test_plotting.py
+
+"""
+Unit tests for the optional plotting utilities
+(src/queue_framework/analysis/plotting.py).
+
+These tests are skipped when the '[analysis]' extras
+(matplotlib, seaborn) are not installed.
+"""
+
+import pytest
+
+matplotlib = pytest.importorskip("matplotlib")
+pytest.importorskip("seaborn")
+matplotlib.use("Agg")  # Headless backend, no display needed
+
+import matplotlib.pyplot as plt
+
+from queue_framework.measure import Measure
+from queue_framework.analysis import plotting
+
+
+@pytest.fixture
+def measure() -> Measure:
+    """
+    Returns a Measure whose last update time lies after its last
+    queue/server state change, so the plots must extend both series.
+    """
+    m = Measure(capacity=1, start_time=0.0)
+    m.log_arrival(1.0)
+    m.log_service_start(time=1.0, wait_time=0.0,
+                        current_queue_length=0, current_busy_servers=1)
+    m.log_arrival(2.0)
+    m.log_queue_entry(time=2.0, current_queue_length=1)
+    m.log_service_end(time=3.0, service_time=2.0, system_time=2.0,
+                      current_busy_servers=0)
+    m.log_arrival(5.0)  # No state change, only moves last_update_time
+    return m
+
+
+def test_time_series_plots_do_not_mutate_the_measure(measure: Measure):
+    """
+    Test that plotting (repeatedly) extends the series to the end
+    time on a copy, leaving the Measure's own logs untouched.
+    """
+    queue_log = measure.queue_length_log
+    busy_log = measure.server_busy_log
+
+    for _ in range(2):
+        fig, ax = plt.subplots()
+        plotting.plot_queue_length_over_time(measure, ax=ax)
+        plotting.plot_server_utilization_over_time(measure, ax=ax)
+        plt.close(fig)
+
+    assert measure.queue_length_log == queue_log
+    assert measure.server_busy_log == busy_log
+
+
+def test_staircase_keeps_time_precision():
+    """
+    Test that steps half a time unit apart stay distinct at large
+    simulation times (float32 would merge 1e7 and 1e7 + 0.5).
+    """
+    import numpy as np
+
+    times = np.array([1e7, 1e7 + 0.5, 1e7 + 1.0])
+    x, y = plotting._staircase(times, np.array([0, 1, 2]))
+
+    assert list(x) == [1e7, 1e7 + 0.5, 1e7 + 0.5, 1e7 + 1.0, 1e7 + 1.0]
+    assert list(y) == [0, 0, 1, 1, 2]
@@ -12,195 +12,456 @@ It verifies that:
 4. The model correctly tracks per-priority KPIs.
 """
 
+import heapq
+import random
+from collections import Counter
+from itertools import accumulate
+
 import pytest
 
 # Import the classes we are testing and the constants
 from queue_framework import (
     PriorityQueueModel,
+    Measure,
     EntityState,
     RequestResult
 )
 
+# Module-level aliases for the constants used in the assertions
+_IDLE = EntityState.IDLE
+_IN_SERVICE = EntityState.IN_SERVICE
+_WAITING = EntityState.WAITING_FOR_RESOURCE
+_SERVED_IMMEDIATELY = RequestResult.SERVED_IMMEDIATELY
+_QUEUED = RequestResult.QUEUED
 
 
-class MockEntity:
-    """
-    A mock entity that satisfies the contract for
-    PriorityQueueModel: a mutable .state attribute AND
-    a .priority attribute.
-    """
-    def __init__(self, name="", priority=1):
-        self.state = EntityState.IDLE
+class _NoPriorityEntity:
+    """An entity with a mutable .state but no .priority attribute."""
+    __slots__ = ("state", "name")
+
+    def __init__(self, name=""):
+        self.state = _IDLE
         self.name = name
-        self.priority = priority  # Required by this model
-    
-    def __repr__(self):
-        return f"MockEntity(name='{self.name}', p={self.priority})"
 
 
+# Queueing scenarios for a busy single server: the (priority,
+# arrival_time) of each entity that queues, and the index of the
+# one that must be served when the server is released.
+SCENARIOS = {
+    "simple_queue": (((5, 11.0),), 0),
+    # The later, higher-priority entity goes first
+    "prio_beats_fifo": (((5, 11.0), (1, 12.0)), 1),
+    # Same priority: the earlier entity goes first
+    "fifo_within_prio": (((5, 11.0), (5, 12.0)), 0),
+}
 
-@pytest.fixture
-def model_cap1() -> PriorityQueueModel:
-    """Returns a fresh, single-server (capacity=1) PriorityQueueModel."""
+
+@pytest.fixture(scope="module")
+def _shared_model_cap1() -> PriorityQueueModel:
+    """Builds the single-server model once for the whole module."""
     return PriorityQueueModel(capacity=1, start_time=0.0)
 
 
+@pytest.fixture
+def model_cap1(_shared_model_cap1: PriorityQueueModel) -> PriorityQueueModel:
+    """Returns an empty, single-server (capacity=1) PriorityQueueModel."""
+    _shared_model_cap1.reset(start_time=0.0)
+    return _shared_model_cap1
+
 
-def test_initialization(model_cap1: PriorityQueueModel):
+def test_initialization():
     """Test that the model initializes with its specific trackers."""
-    assert model_cap1.capacity == 1
-    assert len(model_cap1.queue) == 0  # The heap is a list
-    assert len(model_cap1.users) == 0
+    model = PriorityQueueModel(capacity=1)
+
+    assert model.capacity == 1
+    assert model.start_time == 0.0
+    assert len(model.queue) == 0
+    assert len(model.users) == 0
     # Check that it has both the main and the priority-specific tracker
-    assert hasattr(model_cap1, "kpi_tracker")
-    assert hasattr(model_cap1, "priority_kpi_trackers")
+    assert isinstance(model.kpi_tracker, Measure)
+    assert model.priority_kpi_trackers == {}
 
 
-def test_request_server_free(model_cap1: PriorityQueueModel):
+def test_request_server_free(model_cap1: PriorityQueueModel, make_entity):
     """Test 'request' when a server is available."""
-    entity = MockEntity("e1", priority=1)
+    entity = make_entity("e1", priority=1)
     result = model_cap1.request(entity, current_time=10.0)
     
-    assert result == RequestResult.SERVED_IMMEDIATELY
-    assert entity.state == EntityState.IN_SERVICE
+    assert result == _SERVED_IMMEDIATELY
+    assert entity.state == _IN_SERVICE
     assert entity in model_cap1.users
 
 
-def test_request_server_busy(model_cap1: PriorityQueueModel):
-    """Test 'request' when the server is busy."""
-    e1 = MockEntity("e1_server", priority=1)
-    e2 = MockEntity("e2_queue", priority=5)
-    
-    model_cap1.request(e1, current_time=10.0) # Fill server
-    result = model_cap1.request(e2, current_time=11.0) # Queue e2
-    
-    assert result == RequestResult.QUEUED
-    assert e2.state == EntityState.WAITING_FOR_RESOURCE
-    assert len(model_cap1.queue) == 1
-    # Check heap structure: (priority, time, entity)
-    assert model_cap1.queue[0] == (5, 11.0, e2)
+def test_missing_priority_attribute(model_cap1: PriorityQueueModel):
+    """
+    Test that the model raises an AttributeError if the
+    entity does not have the required '.priority' attribute.
+    """
+    bad_entity = _NoPriorityEntity("bad")
 
+    try:
+        model_cap1.request(bad_entity, current_time=10.0)
+    except AttributeError:
+        pass
+    else:
+        pytest.fail("request() did not raise AttributeError")
+    assert bad_entity not in model_cap1.users
 
-def test_release_queue_empty(model_cap1: PriorityQueueModel):
+
+def test_release_queue_empty(model_cap1: PriorityQueueModel, make_entity):
     """Test 'release' when the queue is empty."""
-    entity = MockEntity("e1", priority=1)
+    entity = make_entity("e1", priority=1)
     model_cap1.request(entity, current_time=10.0)
     
     next_entity = model_cap1.release(entity, current_time=15.0)
     
     assert next_entity is None
-    assert entity.state == EntityState.IDLE
+    assert entity.state == _IDLE
     assert len(model_cap1.users) == 0
 
 
-def test_priority_logic_over_fifo(model_cap1: PriorityQueueModel):
+def _assert_queue(model: PriorityQueueModel, expected: list):
     """
-    Test the core priority logic.
-    - e1 fills the server.
-    - e2 (LOW prio) enters the queue first.
-    - e3 (HIGH prio) enters the queue second.
-    - When e1 releases, e3 should be served (not e2).
+    Checks the queue against (priority, time, entity) entries field by
+    field, comparing entities by identity.
     """
-    e1 = MockEntity("e1_server", priority=1)
-    e2 = MockEntity("e2_low_prio", priority=5)
-    e3 = MockEntity("e3_high_prio", priority=1) # Higher prio (lower num)
-    
-    # Action (Phase 1: Load the system)
-    model_cap1.request(e1, current_time=10.0)
-    model_cap1.request(e2, current_time=11.0) # e2 (prio 5) enters queue
-    model_cap1.request(e3, current_time=12.0) # e3 (prio 1) enters queue
-    
-    # Pre-check: The heap's top item (index 0) should be e3
-    assert len(model_cap1.queue) == 2
-    assert model_cap1.queue[0] == (1, 12.0, e3) # e3 is at the front
-    
-    # Action (Phase 2: Release and check Priority)
-    next_entity = model_cap1.release(e1, current_time=15.0)
-    
-    # Assertions
-    assert next_entity == e3  # Verifies Priority > FIFO
-    assert e1.state == EntityState.IDLE
-    assert e3.state == EntityState.IN_SERVICE
-    assert e2.state == EntityState.WAITING_FOR_RESOURCE
-    assert len(model_cap1.users) == 1
-    assert e3 in model_cap1.users
-    assert len(model_cap1.queue) == 1
-    assert model_cap1.queue[0][2] == e2 # e2 is now at the front
+    queue = model.queue
+    assert len(queue) == len(expected)
+    for (priority, time, entity), (exp_priority, exp_time, exp_entity) \
+            in zip(queue, expected):
+        assert priority == exp_priority
+        assert time == exp_time
+        assert entity is exp_entity
 
 
-def test_fifo_logic_within_priority(model_cap1: PriorityQueueModel):
+@pytest.mark.ordering
+@pytest.mark.parametrize("scenario", SCENARIOS)
+def test_queue_and_release_order(model_cap1: PriorityQueueModel,
+                                 scenario: str, make_entity):
     """
-    Test the FIFO "tie-breaking" logic.
+    Test the queueing and service order.
     - e1 fills the server.
-    - e2 (prio 5) enters the queue first.
-    - e3 (prio 5) enters the queue second.
-    - When e1 releases, e2 should be served (not e3).
+    - The scenario's entities enter the queue.
+    - When e1 releases, the lowest priority number is served,
+      with FIFO as the tie-breaker.
     """
-    e1 = MockEntity("e1_server", priority=1)
-    e2 = MockEntity("e2_prio5_first", priority=5)
-    e3 = MockEntity("e3_prio5_second", priority=5)
-    
-    # Action (Load the system)
+    e1 = make_entity("e1_server", priority=1)
     model_cap1.request(e1, current_time=10.0)
-    model_cap1.request(e2, current_time=11.0) # e2 (prio 5, time 11)
-    model_cap1.request(e3, current_time=12.0) # e3 (prio 5, time 12)
-    
-    # Pre-check: The heap's top item should be e2 (due to earlier time)
-    assert len(model_cap1.queue) == 2
-    assert model_cap1.queue[0] == (5, 11.0, e2)
-    
-    # Action (Release and check FIFO)
+    arrivals, expected_next = SCENARIOS[scenario]
+
+    # Action (Phase 1: Load the system)
+    arrived, waiting = [], []
+    for i, (priority, time) in enumerate(arrivals):
+        entity = make_entity(f"e{i + 2}_prio{priority}", priority=priority)
+        result = model_cap1.request(entity, current_time=time)
+
+        assert result == _QUEUED
+        assert entity.state == _WAITING
+        arrived.append(entity)
+        waiting.append((priority, time, entity))
+
+    # Pre-check: the queue lists (priority, time, entity) in service order
+    waiting.sort(key=lambda item: item[:2])
+    _assert_queue(model_cap1, waiting)
+
+    # Action (Phase 2: Release and check the order)
     next_entity = model_cap1.release(e1, current_time=15.0)
-    
+
     # Assertions
-    assert next_entity == e2  # Verifies FIFO within priority
-    assert e1.state == EntityState.IDLE
-    assert e2.state == EntityState.IN_SERVICE
-    assert e3.state == EntityState.WAITING_FOR_RESOURCE
-    assert len(model_cap1.queue) == 1
-    assert model_cap1.queue[0][2] == e3
+    winner = arrived[expected_next]
+    assert next_entity is winner
+    assert waiting.pop(0)[2] is winner
+    assert e1.state == _IDLE
+    assert winner.state == _IN_SERVICE
+    assert list(model_cap1.users) == [winner]
+    _assert_queue(model_cap1, waiting)
+    for *_, entity in waiting:
+        assert entity.state == _WAITING
 
 
-def test_kpi_breakdown_exists(model_cap1: PriorityQueueModel):
+@pytest.mark.kpi
+def test_kpi_breakdown_exists(model_cap1: PriorityQueueModel, make_entity):
     """
     Test that the per-priority KPI trackers are being populated.
     """
-    e1 = MockEntity("e1_prio1", priority=1)
-    e2 = MockEntity("e2_prio5", priority=5)
+    e1 = make_entity("e1_prio1", priority=1)
+    e2 = make_entity("e2_prio5", priority=5)
     
     # Run a mini-simulation
     model_cap1.request(e1, 1.0) # Served
     model_cap1.request(e2, 2.0) # Queued
     model_cap1.release(e1, 3.0) # e2 served
-    model_cap1.release(e2, 4.0) # e2 released
+    model_cap1.release(e2, 4.0) # e2 (in service since T=3) leaves
     
-    # Get final KPIs
+    # Get final KPIs (once) and check that each level's tracker
+    # recorded its own arrival and service
     kpis = model_cap1.get_final_kpis(simulation_end_time=5.0)
-    
-    # Check that the breakdown structure exists and was populated
-    assert "priority_breakdown" in kpis
-    assert 1 in kpis["priority_breakdown"] # Key for prio 1
-    assert 5 in kpis["priority_breakdown"] # Key for prio 5
-    
-    # Check that the trackers recorded the arrivals
-    p1_stats = kpis["priority_breakdown"][1]
-    p5_stats = kpis["priority_breakdown"][5]
-    assert p1_stats["arrivals_and_throughput"]["total_arrivals"] == 1
-    assert p5_stats["arrivals_and_throughput"]["total_arrivals"] == 1
+    counters = {
+        priority: (stats["arrivals_and_throughput"]["total_arrivals"],
+                   stats["arrivals_and_throughput"]["total_served"])
+        for priority, stats in kpis["priority_breakdown"].items()
+    }
+    assert counters == {1: (1, 1), 5: (1, 1)}
 
 
-def test_missing_priority_attribute(model_cap1: PriorityQueueModel):
+def _gen_workload(n: int, seed: int = 0):
     """
-    Test that the model raises an AttributeError if the
-    entity does not have the required '.priority' attribute.
+    Generates a reproducible workload of 'n' entities: their
+    priorities (1-9), increasing arrival times (exponential
+    inter-arrivals, mean 1) and service durations (exponential,
+    mean 0.8).
     """
-    # This mock entity is "bad" - it lacks '.priority'
-    class BadEntity:
-        def __init__(self):
-            self.state = EntityState.IDLE
-            
-    bad_entity = BadEntity()
-    
-    # Using pytest.raises to assert that an error *is* thrown
+    rng = random.Random(seed)
+    priorities = [rng.randint(1, 9) for _ in range(n)]
+    arrival_times = list(accumulate(rng.expovariate(1.0) for _ in range(n)))
+    service_times = [rng.expovariate(1.25) for _ in range(n)]
+    return priorities, arrival_times, service_times
+
+
+@pytest.mark.kpi
+def test_kpi_breakdown_workload(model_cap1: PriorityQueueModel, make_entity):
+    """
+    Test the priority breakdown on a longer, randomly generated run:
+    every entity arrives, waits if needed, and is served to the end.
+    """
+    priorities, arrival_times, service_times = _gen_workload(500)
+    entities = [make_entity(f"e{i}", priority=priority)
+                for i, priority in enumerate(priorities)]
+    durations = dict(zip(entities, service_times))
+
+    # Events are (time, sequence, entity): arrivals first, then the
+    # departures scheduled whenever an entity starts service.
+    events = [(time, i, entity)
+              for i, (time, entity) in enumerate(zip(arrival_times, entities))]
+    heapq.heapify(events)
+    seq = len(events)
+    end_time = 0.0
+    while events:
+        end_time, _, entity = heapq.heappop(events)
+        if entity.state == _IDLE:
+            if model_cap1.request(entity, end_time) == _QUEUED:
+                continue
+            started = entity
+        else:
+            started = model_cap1.release(entity, end_time)
+            if started is None:
+                continue
+        heapq.heappush(events, (end_time + durations[started], seq, started))
+        seq += 1
+
+    assert len(model_cap1.users) == 0
+    assert model_cap1.queue == []
+
+    kpis = model_cap1.get_final_kpis(simulation_end_time=end_time)
+    breakdown = kpis["priority_breakdown"]
+    expected = Counter(priorities)
+    counters = {
+        priority: (stats["arrivals_and_throughput"]["total_arrivals"],
+                   stats["arrivals_and_throughput"]["total_served"])
+        for priority, stats in breakdown.items()
+    }
+    assert counters == {p: (n, n) for p, n in expected.items()}
+    assert kpis["arrivals_and_throughput"]["total_served"] == 500
+    assert sum(stats["wait_time"]["count"] for stats in breakdown.values()) \
+        == kpis["wait_time"]["count"]
+
+
+@pytest.mark.kpi
+def test_per_priority_queue_length(model_cap1: PriorityQueueModel,
+                                   make_entity):
+    """
+    Test that each priority tracker logs the queue length of its
+    own priority level, while the main tracker logs the total.
+    """
+    model_cap1.request(make_entity("e1", priority=1), 1.0) # Served
+    model_cap1.request(make_entity("e2", priority=5), 2.0) # Queued (P5: 1)
+    model_cap1.request(make_entity("e3", priority=1), 3.0) # Queued (P1: 1)
+    model_cap1.request(make_entity("e4", priority=5), 4.0) # Queued (P5: 2)
+
+    p5_tracker = model_cap1.priority_kpi_trackers[5]
+    assert list(p5_tracker.queue_length_values) == [0, 1, 2]
+    assert list(model_cap1.kpi_tracker.queue_length_values) == [0, 0, 1, 2, 3]
+
+
+@pytest.mark.ordering
+def test_queue_serves_levels_in_order(model_cap1: PriorityQueueModel,
+                                      make_entity):
+    """
+    Test that the queue drains priority levels in order, FIFO
+    within each, including a level that empties and refills.
+    """
+    server = make_entity("server", priority=1)
+    model_cap1.request(server, 0.0)
+    waiting = [make_entity("a", 3), make_entity("b", 2),
+               make_entity("c", 3), make_entity("d", 1)]
+    for t, entity in enumerate(waiting, start=1):
+        model_cap1.request(entity, float(t))
+
+    assert [e.name for _, _, e in model_cap1.queue] == ["d", "b", "a", "c"]
+
+    served = []
+    current = server
+    for t in range(10, 14):
+        current = model_cap1.release(current, float(t))
+        served.append(current.name)
+        if current.name == "d":
+            # Refill the emptied top level
+            model_cap1.request(make_entity("e", 1), float(t))
+
+    assert served == ["d", "e", "b", "a"]
+    assert [e.name for _, _, e in model_cap1.queue] == ["c"]
+
+
+def _run_two_server_scenario(batch: bool, make_entity) -> dict:
+    """
+    Two servers, three waiters; both servers are released at T=10,
+    either one by one or in a single release_many() call.
+    """
+    model = PriorityQueueModel(capacity=2, start_time=0.0)
+    s1, s2 = make_entity("s1", 1), make_entity("s2", 1)
+    waiters = [make_entity("w1", 5), make_entity("w2", 1),
+               make_entity("w3", 2)]
+    for t, entity in enumerate([s1, s2] + waiters):
+        model.request(entity, float(t))
+
+    if batch:
+        started = model.release_many([s1, s2], current_time=10.0)
+    else:
+        started = [model.release(s1, 10.0), model.release(s2, 10.0)]
+
+    assert [e.name for e in started] == ["w2", "w3"]
+    assert [e.name for _, _, e in model.queue] == ["w1"]
+    return model.get_final_kpis(simulation_end_time=20.0)
+
+
+@pytest.mark.kpi
+def test_release_many_matches_sequential_releases(make_entity):
+    """Test that a batch release yields the same KPIs as single ones."""
+    assert _run_two_server_scenario(True, make_entity) == \
+        _run_two_server_scenario(False, make_entity)
+
+
+def test_release_many_invalid_entity(model_cap1: PriorityQueueModel,
+                                     make_entity):
+    """Test that a batch with a foreign entity releases nothing."""
+    e1 = make_entity("e1")
+    model_cap1.request(e1, 10.0)
+
+    with pytest.raises(ValueError):
+        model_cap1.release_many([e1, make_entity("stranger")], 15.0)
+    assert e1 in model_cap1.users
+
+
+@pytest.mark.kpi
+def test_register_priorities(model_cap1: PriorityQueueModel, make_entity):
+    """Test that registered levels get trackers before any arrival."""
+    model_cap1.register_priorities([1, 2, 3])
+
+    tracker_2 = model_cap1.priority_kpi_trackers[2]
+    model_cap1.request(make_entity("e1", priority=2), 1.0)
+
+    assert model_cap1.priority_kpi_trackers[2] is tracker_2
+    kpis = model_cap1.get_final_kpis(simulation_end_time=5.0)
+    assert sorted(kpis["priority_breakdown"]) == [1, 2, 3]
+    assert kpis["priority_breakdown"][3]["arrivals_and_throughput"][
+        "total_arrivals"] == 0
+
+
+@pytest.mark.kpi
+def test_get_final_kpis_returns_fresh_reports(model_cap1: PriorityQueueModel,
+                                              make_entity):
+    """
+    Test that repeated reports are equal but distinct dictionaries,
+    that mutating one does not affect the next, and that a new event
+    changes the result.
+    """
+    e1 = make_entity("e1", priority=1)
+    model_cap1.request(e1, 1.0)
+
+    kpis = model_cap1.get_final_kpis(simulation_end_time=5.0)
+    again = model_cap1.get_final_kpis(simulation_end_time=5.0)
+    assert again == kpis
+    assert again is not kpis
+    assert again["priority_breakdown"] is not kpis["priority_breakdown"]
+
+    kpis["priority_breakdown"].pop(1)
+    kpis["arrivals_and_throughput"]["total_rejections"] = 99
+    assert model_cap1.get_final_kpis(simulation_end_time=5.0) == again
+
+    model_cap1.release(e1, 4.0)
+    refreshed = model_cap1.get_final_kpis(simulation_end_time=5.0)
+    assert refreshed["arrivals_and_throughput"]["total_served"] == 1
+
+
+@pytest.mark.kpi
+def test_reset(model_cap1: PriorityQueueModel, make_entity):
+    """Test that reset() empties the model and its trackers in place."""
+    kpi_tracker = model_cap1.kpi_tracker
+    for i, priority in enumerate((1, 5, 5)):
+        model_cap1.request(make_entity(f"e{i}", priority=priority), float(i))
+
+    model_cap1.reset(start_time=50.0)
+
+    assert model_cap1.start_time == 50.0
+    assert model_cap1.queue == []
+    assert len(model_cap1.users) == 0
+    assert model_cap1.priority_kpi_trackers == {}
+    assert model_cap1.kpi_tracker is kpi_tracker
+    assert kpi_tracker.total_arrivals == 0
+
+    entity = make_entity("after_reset", priority=3)
+    result = model_cap1.request(entity, current_time=51.0)
+    assert result == _SERVED_IMMEDIATELY
+    kpis = model_cap1.get_final_kpis(simulation_end_time=60.0)
+    assert list(kpis["priority_breakdown"]) == [3]
+
+
+def test_state_update_failure_leaves_model_unchanged(
+        model_cap1: PriorityQueueModel, make_entity, make_lockable_entity):
+    """
+    Test that, as in the FIFO models, an entity whose .state cannot be
+    written makes request()/release() raise AttributeError before the
+    model changes.
+    """
+    stuck = make_lockable_entity("stuck", priority=2)
+    stuck.locked = True
+    with pytest.raises(AttributeError):
+        model_cap1.request(stuck, current_time=0.0)
+    assert len(model_cap1.users) == 0
+    assert model_cap1.priority_kpi_trackers == {}
+
+    e1 = make_lockable_entity("e1", priority=1)
+    model_cap1.request(e1, current_time=1.0)
     with pytest.raises(AttributeError):
-        model_cap1.request(bad_entity, current_time=10.0)
\ No newline at end of file
+        model_cap1.request(stuck, current_time=2.0)
+    assert model_cap1.queue == []
+
+    e2 = make_entity("e2", priority=3)
+    model_cap1.request(e2, current_time=3.0)
+    e1.locked = True
+    with pytest.raises(AttributeError):
+        model_cap1.release(e1, current_time=4.0)
+    assert list(model_cap1.users) == [e1]
+    _assert_queue(model_cap1, [(3, 3.0, e2)])
+    assert model_cap1.kpi_tracker.total_served == 0
+
+
+def test_release_many_state_failure_releases_nothing(make_lockable_entity):
+    """
+    Test that a batch with an entity whose .state cannot be written
+    raises AttributeError and releases nobody, restoring the states
+    already updated.
+    """
+    model = PriorityQueueModel(capacity=2, start_time=0.0)
+    e1 = make_lockable_entity("e1")
+    e2 = make_lockable_entity("e2")
+    model.request(e1, 1.0)
+    model.request(e2, 2.0)
+    e2.locked = True
+
+    with pytest.raises(AttributeError):
+        model.release_many([e1, e2], current_time=3.0)
+
+    assert set(model.users) == {e1, e2}
+    assert e1.state == _IN_SERVICE
+    assert model.kpi_tracker.total_served == 0